@@ -63,6 +63,11 @@ function(webbridge_generate)
 		set(arg_LANGUAGE cpp)
 	endif()
 
+	# Persistent parse cache shared by discoverer.py and generate.py
+	set(webbridge_cache_env
+		${CMAKE_COMMAND} -E env "WEBBRIDGE_CACHE_DIR=${CMAKE_BINARY_DIR}/.webbridge_cache"
+	)
+
 	# Collect files to process
 	set(all_files)
 
@@ -87,7 +92,7 @@ function(webbridge_generate)
 
 		if(header_files)
 			execute_process(
-				COMMAND ${Python_EXECUTABLE}
+				COMMAND ${webbridge_cache_env} ${Python_EXECUTABLE}
 				${CMAKE_SOURCE_DIR}/tools/discoverer.py
 					${header_files}
 				WORKING_DIRECTORY ${CMAKE_CURRENT_SOURCE_DIR}
@@ -112,7 +117,7 @@ function(webbridge_generate)
 		endforeach()
 
 		execute_process(
-			COMMAND ${Python_EXECUTABLE}
+			COMMAND ${webbridge_cache_env} ${Python_EXECUTABLE}
 			${CMAKE_SOURCE_DIR}/tools/discoverer.py
 				${abs_files}
 			WORKING_DIRECTORY ${CMAKE_CURRENT_SOURCE_DIR}
@@ -181,7 +186,7 @@ function(webbridge_generate)
 	list(LENGTH all_files file_count)
 	add_custom_command(
 		OUTPUT ${all_output_files}
-		COMMAND ${Python_EXECUTABLE}
+		COMMAND ${webbridge_cache_env} ${Python_EXECUTABLE}
 			${CMAKE_SOURCE_DIR}/tools/generate.py
 			--batch
 			${batch_args}
@@ -190,6 +195,7 @@ function(webbridge_generate)
 		DEPENDS
 			${CMAKE_SOURCE_DIR}/tools/generate.py
 			${CMAKE_SOURCE_DIR}/tools/parser.py
+			${CMAKE_SOURCE_DIR}/tools/_ast_cache.py
 			${CMAKE_SOURCE_DIR}/tools/tstypes.py
 			${template_files}
 			${all_input_files}
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+webbridge AST Cache
+
+Persistent on-disk cache for results extracted from C++ headers
+(ClassInfo objects, discovered class names). Entries are keyed by the
+SHA-256 of the header content, so unchanged headers skip tree-sitter
+entirely on incremental builds and changed headers invalidate naturally.
+
+The cache is enabled by setting the environment variable
+WEBBRIDGE_CACHE_DIR (CMake points it at ${CMAKE_BINARY_DIR}/.webbridge_cache).
+Without it, get() always misses and put() is a no-op.
+
+Entries live in a single SQLite database (parser.db) inside that
+directory. WAL journaling and autocommit keep writes cheap and allow
+several discoverer/generator processes to use the cache concurrently.
+
+The digest of the tool sources, the tree-sitter and grammar versions and the
+pickle protocol is part of every key, so results produced by an older parser
+or grammar are never reused.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+_ENV_VAR = 'WEBBRIDGE_CACHE_DIR'
+_DB_NAME = 'parser.db'
+_TOOL_SOURCES = ('parser.py', 'discoverer.py', '_ast_cache.py')
+# Die Parse-Ergebnisse hängen auch von Parser-Bibliothek und Grammatik ab
+_TOOL_PACKAGES = ('tree-sitter', 'tree-sitter-cpp')
+
+# Eine Verbindung pro Prozess, neu aufgebaut wenn sich das Cache-Verzeichnis ändert
+_connection: Optional[sqlite3.Connection] = None
+_connection_dir: Optional[Path] = None
+
+
+@functools.lru_cache(maxsize=None)
+def _tools_digest() -> bytes:
+    """Hash the sources of the tools whose results are cached, plus the
+    versions of the packages they depend on and the pickle protocol.
+
+    Computed on first use: importlib.metadata alone takes ~30 ms to import,
+    processes running without cache never pay for it.
+    """
+    import importlib.metadata
+    h = hashlib.sha256()
+    tools_dir = Path(__file__).parent
+    for name in _TOOL_SOURCES:
+        try:
+            h.update((tools_dir / name).read_bytes())
+        except OSError:
+            pass
+    for package in _TOOL_PACKAGES:
+        try:
+            version = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            version = 'unknown'
+        h.update(f'{package}={version}\0'.encode('utf-8'))
+    h.update(f'pickle={pickle.HIGHEST_PROTOCOL}'.encode('utf-8'))
+    return h.digest()
+
+
+def _cache_dir() -> Optional[Path]:
+    """Return the cache directory, or None if caching is disabled."""
+    cache_dir = os.environ.get(_ENV_VAR)
+    return Path(cache_dir) if cache_dir else None
+
+
+def _connect() -> Optional[sqlite3.Connection]:
+    """Return the database connection, or None if caching is disabled or unavailable."""
+    global _connection, _connection_dir
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return None
+    if _connection is not None and _connection_dir == cache_dir:
+        return _connection
+
+    if _connection is not None:
+        _connection.close()
+        _connection = _connection_dir = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(cache_dir / _DB_NAME, timeout=30, isolation_level=None)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, blob BLOB NOT NULL)')
+    except (OSError, sqlite3.Error):
+        return None
+    _connection, _connection_dir = connection, cache_dir
+    return connection
+
+
+def enabled() -> bool:
+    """Return True if the cache is enabled for this process."""
+    return _cache_dir() is not None
+
+
+def cache_key(source_code: bytes, tag: str) -> str:
+    """Build the cache key for a header content and a result tag.
+
+    Args:
+        source_code: Raw header content
+        tag: Kind of cached result (e.g. 'classinfo:MyObject')
+
+    Returns:
+        Hex digest usable as file name
+    """
+    h = hashlib.sha256(_tools_digest())
+    h.update(tag.encode('utf-8'))
+    h.update(b'\0')
+    h.update(source_code)
+    return h.hexdigest()
+
+
+def get(key: str) -> Optional[bytes]:
+    """Return the cached blob for key, or None on a miss."""
+    connection = _connect()
+    if connection is None:
+        return None
+    try:
+        row = connection.execute('SELECT blob FROM cache WHERE key = ?', (key,)).fetchone()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def put(key: str, blob: bytes):
+    """Store blob under key. Errors are ignored, the cache is best-effort."""
+    connection = _connect()
+    if connection is None:
+        return
+    try:
+        connection.execute('INSERT OR REPLACE INTO cache (key, blob) VALUES (?, ?)', (key, blob))
+    except sqlite3.Error:
+        pass
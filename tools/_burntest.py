@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+webbridge Burntest Runner
+
+Shared entry point of the burn test modules (test_parser.py, test_tstypes.py):
+prints a banner, runs pytest on one test file and reports the result.
+"""
+
+import importlib.util
+import pytest
+
+# Der Burntest braucht weder Cache noch Stepwise: Plugins gar nicht erst laden
+_BASE_ARGS = ("--tb=short", "-q", "--no-header", "-p", "no:cacheprovider", "-p", "no:stepwise")
+
+
+def run(label: str, test_file: str, parallel: bool = False) -> int:
+    """Run all tests of a file and print a summary report.
+
+    Args:
+        label: Name shown in the banner (e.g. 'tstypes')
+        test_file: Test module to run (usually __file__ of the caller)
+        parallel: Distribute the test classes over all cores if pytest-xdist is installed
+
+    Returns:
+        pytest exit code
+    """
+    print("=" * 80)
+    print(f"{label} - Burntest")
+    print("=" * 80)
+    print()
+
+    args = [test_file, *_BASE_ARGS]
+    if parallel and importlib.util.find_spec("xdist") is not None:
+        # Testklassen sind unabhängig: pro Klasse auf alle Kerne verteilen
+        args += ["-n", "auto", "--dist=loadscope", "--maxfail=1"]
+    else:
+        args.append("-x")  # Stop bei erstem Fehler
+
+    # Führe pytest aus
+    exit_code = pytest.main(args)
+
+    print()
+    print("=" * 80)
+    if exit_code == 0:
+        print("✅ Alle Tests erfolgreich!")
+    else:
+        print("❌ Einige Tests fehlgeschlagen!")
+    print("=" * 80)
+
+    return exit_code
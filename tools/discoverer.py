@@ -15,11 +15,22 @@ Ausgabe:
 Inspiriert von Qt's MOC Auto-Discovery Mechanismus.
 """
 
+import os
 import sys
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List
-import tree_sitter_cpp as tscpp
-from tree_sitter import Parser, Language
+import _ast_cache
+# Parser und Klassensuche teilt sich der Discoverer mit parser.py: beide sehen
+# dieselben Klassen (keine verschachtelten oder funktionslokalen)
+from parser import _PARSER, _TYPE_IDENTIFIER, _find_child_by_type, _iter_class_nodes, parse_header_all_bytes
+
+# Ab dieser Anzahl Header lohnt sich der Start eines Prozess-Pools
+_PARALLEL_THRESHOLD = 16
+
+# Nur Klassen mit Basisklassen-Liste können von webbridge::object erben
+_BASE_CLASS_CLAUSE = frozenset({'base_class_clause'})
 
 
 def find_webbridge_classes(header_file: str) -> List[str]:
@@ -37,65 +48,60 @@ def find_webbridge_classes(header_file: str) -> List[str]:
         if not path.exists() or not path.suffix.lower() in ['.h', '.hpp']:
             return []
 
-        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        # Binär lesen: der Vorab-Check braucht keine UTF-8-Dekodierung
+        source_code = path.read_bytes()
 
-        # Schneller String-Check (optimiert für CMake Performance)
+        # Schneller Byte-Check (optimiert für CMake Performance)
         # Supports both old PascalCase and new snake_case naming
-        if 'webbridge::Object' not in content and 'webbridge::object' not in content:
+        if b'webbridge::Object' not in source_code and b'webbridge::object' not in source_code:
             return []
 
-        # Falls String-Check positiv: Parse mit tree-sitter
+        # Persistenter Cache: unveränderte Header werden nicht erneut geparst
+        # (ohne Cache gar keinen Schlüssel berechnen)
+        key = _ast_cache.cache_key(source_code, 'class-names') if _ast_cache.enabled() else None
+        if key is not None:
+            blob = _ast_cache.get(key)
+            if blob is not None:
+                return pickle.loads(blob)
+
+        # Falls Byte-Check positiv: Parse mit tree-sitter
         try:
-            parser = Parser(Language(tscpp.language()))
-            tree = parser.parse(content.encode('utf-8'))
+            tree = _PARSER.parse(source_code)
 
-            # Sammle alle Klassennamen
+            # Sammle alle Klassennamen, die von webbridge::object erben
             class_names = []
-            _find_class_names(tree.root_node, content, class_names)
-            return class_names
+            for class_node, _ in _iter_class_nodes(source_code, tree.root_node, []):
+                name_node = _find_child_by_type(class_node, _TYPE_IDENTIFIER)
+                bases_node = _find_child_by_type(class_node, _BASE_CLASS_CLAUSE)
+                if name_node is None or bases_node is None:
+                    continue
+                base_text = source_code[bases_node.start_byte:bases_node.end_byte]
+                # Supports both old PascalCase and new snake_case naming
+                if b'Object' in base_text or b'object' in base_text:
+                    class_name = source_code[name_node.start_byte:name_node.end_byte].strip()
+                    class_names.append(class_name.decode('utf-8', errors='ignore'))
+            if key is not None:
+                _ast_cache.put(key, pickle.dumps(class_names, protocol=pickle.HIGHEST_PROTOCOL))
         except Exception as e:
             print(f"# Parse-Fehler bei {header_file}: {e}", file=sys.stderr)
             return []
 
+        # ClassInfo aus demselben Baum vorab in den Cache legen: generate.py
+        # findet sie dort und muss den Header nicht erneut parsen. Rein optional,
+        # ein Fehler darf das Ergebnis der Discovery nicht verändern
+        if class_names and _ast_cache.enabled():
+            try:
+                parse_header_all_bytes(source_code, class_names, tree=tree)
+            except Exception as e:
+                print(f"# Cache-Vorbereitung fehlgeschlagen bei {header_file}: {e}", file=sys.stderr)
+        return class_names
+
     except Exception as e:
         # Fehlertoleranz - Datei überspringen
         print(f"# Fehler bei {header_file}: {e}", file=sys.stderr)
         return []
 
 
-def _find_class_names(node, content: str, class_names: List[str]):
-    """
-    Rekursive Suche nach Klassennamen die von webbridge::object erben
-
-    Args:
-        node: AST-Knoten
-        content: Source-Code
-        class_names: Liste zum Sammeln der Klassennamen
-    """
-    if node.type == 'class_specifier':
-        class_name = None
-        inherits_webbridge = False
-
-        # Suche type_identifier (Klassenname) und base_class_clause
-        for child in node.children:
-            if child.type == 'type_identifier':
-                class_name = content[child.start_byte:child.end_byte].strip()
-            elif child.type == 'base_class_clause':
-                base_text = content[child.start_byte:child.end_byte]
-                # Supports both old PascalCase and new snake_case naming
-                if 'webbridge::Object' in base_text or 'webbridge::object' in base_text or 'Object' in base_text or 'object' in base_text:
-                    inherits_webbridge = True
-
-        # Nur hinzufügen wenn Name und webbridge::object Vererbung vorhanden
-        if class_name and inherits_webbridge:
-            class_names.append(class_name)
-
-    # Rekurse in Kinder-Knoten
-    for child in node.children:
-        _find_class_names(child, content, class_names)
-
-
 def main():
     """
     Main Entry-Point für CMake-Integration.
@@ -109,9 +115,16 @@ def main():
         sys.exit(1)
 
     results: List[str] = []
+    header_files = sys.argv[1:]
+
+    # Header sind unabhängig voneinander: bei vielen Dateien parallel parsen
+    if len(header_files) >= _PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            all_class_names = list(executor.map(find_webbridge_classes, header_files, chunksize=8))
+    else:
+        all_class_names = [find_webbridge_classes(header_file) for header_file in header_files]
 
-    for header_file in sys.argv[1:]:
-        class_names = find_webbridge_classes(header_file)
+    for header_file, class_names in zip(header_files, all_class_names):
         for class_name in class_names:
             results.append(f"{header_file}|{class_name}")
 
@@ -8,10 +8,16 @@ Nutzt tree-sitter für schnelles C++ AST-Parsing und Jinja2 für Template-Render
 Verwendung:
     # Einzelne Datei:
     python generate.py <input.h> --class-name <ClassName> --cpp_out=<dir> --ts_impl_out=<dir>
+
+    # Mehrere Klassen einer Datei (Header wird nur einmal geparst):
+    python generate.py <input.h> --classes Class1,Class2 --cpp_out=<dir>
     
     # Batch-Verarbeitung mehrerer Dateien:
     python generate.py --batch file1.h|Class1 file2.h|Class2 --cpp_out=<dir> --ts_impl_out=<dir>
 
+    # Server-Modus (ein Prozess für beliebig viele Jobs, JSON-Zeilen über stdin):
+    python generate.py --server [--cpp_out=<dir>] [--ts_impl_out=<dir>]
+
 Beispiel:
     python generate.py ../src/MyObject.h --class-name MyObject --cpp_out=../build/src
     python generate.py ../src/MyObject.h --class-name MyObject --ts_impl_out=../frontend/src
@@ -24,12 +30,16 @@ Voraussetzungen:
 Bis C++26 Reflection verfügbar ist, dient dieses Script als Übergangslösung.
 """
 
+import os
 import sys
+import json
 import argparse
+import filecmp
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
+from typing import Dict, List
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 from tstypes import cpp_to_ts_type
-from parser import ClassInfo, parse_header
+from parser import ClassInfo, parse_header_all
 
 
 # =============================================================================
@@ -56,6 +66,24 @@ def json_names(collection):
 # Globale Jinja2-Umgebung (initialisiert einmal)
 # =============================================================================
 
+def _bytecode_cache() -> FileSystemBytecodeCache:
+    """Liefert den Cache für kompilierten Template-Bytecode.
+
+    Mit WEBBRIDGE_CACHE_DIR liegt er im Build-Cache neben parser.db, sonst im
+    benutzereigenen Standardverzeichnis von Jinja2. Jinja2 prüft die Checksumme
+    der Template-Quelle, veraltete Einträge werden automatisch neu erzeugt.
+    """
+    cache_dir = os.environ.get('WEBBRIDGE_CACHE_DIR')
+    if cache_dir:
+        jinja_dir = Path(cache_dir) / 'jinja'
+        try:
+            jinja_dir.mkdir(parents=True, exist_ok=True)
+            return FileSystemBytecodeCache(str(jinja_dir))
+        except OSError:
+            pass
+    return FileSystemBytecodeCache()
+
+
 def _setup_jinja_env() -> Environment:
     """Initialisiert die globale Jinja2-Umgebung mit allen Filtern."""
     template_dir = Path(__file__).parent / "templates"
@@ -64,6 +92,8 @@ def _setup_jinja_env() -> Environment:
 
     env = Environment(
         loader=FileSystemLoader(str(template_dir)),
+        bytecode_cache=_bytecode_cache(),
+        auto_reload=False,
         autoescape=False,
         trim_blocks=True,
         lstrip_blocks=True,
@@ -80,19 +110,59 @@ def _setup_jinja_env() -> Environment:
 
 _JINJA_ENV = _setup_jinja_env()
 
+# Die mitgelieferten Templates werden einmal beim Import kompiliert;
+# danach kostet jeder Zugriff nur noch einen Dict-Lookup
+_TEMPLATE_NAMES = ("registration_header.h.j2", "registration_impl.cpp.j2", "impl.ts.j2")
+_TEMPLATES: Dict[str, Template] = {name: _JINJA_ENV.get_template(name) for name in _TEMPLATE_NAMES}
+
 
 # =============================================================================
 # Code-Generatoren (Funktionen)
 # =============================================================================
 
-def generate_registration_header(cls: ClassInfo, header_path: str) -> str:
-    """Generiert die C++ _registration.h Header-Datei."""
+def _get_template(template_name: str) -> Template:
+    """Lädt ein Template (vorkompiliert oder aus der globalen Jinja2-Umgebung)."""
+    template = _TEMPLATES.get(template_name)
+    if template is not None:
+        return template
     try:
-        template = _JINJA_ENV.get_template("registration_header.h.j2")
+        return _JINJA_ENV.get_template(template_name)
     except Exception as e:
-        raise FileNotFoundError(f"Konnte Template 'registration_header.h.j2' nicht laden: {e}") from e
+        raise FileNotFoundError(f"Konnte Template '{template_name}' nicht laden: {e}") from e
+
+
+def _render_to_file(template_name: str, cls: ClassInfo, header_path: str, output_path: Path) -> bool:
+    """Rendert ein Template direkt in eine Datei.
+
+    Die Ausgabe wird stückweise in eine temporäre Datei geschrieben, ohne
+    den kompletten Code vorher als String im Speicher aufzubauen. Ist der
+    Inhalt unverändert, bleibt die bestehende Datei (und ihre mtime)
+    erhalten, damit abhängige Übersetzungseinheiten nicht neu gebaut werden.
+
+    Returns:
+        True wenn die Datei neu geschrieben wurde, False wenn unverändert
+    """
+    stream = _get_template(template_name).stream(
+        cls=cls,
+        header_path=Path(header_path).name,
+    )
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            stream.dump(f)
+        if output_path.exists() and filecmp.cmp(tmp_path, output_path, shallow=False):
+            tmp_path.unlink()
+            return False
+        os.replace(tmp_path, output_path)
+        return True
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
-    return template.render(
+def generate_registration_header(cls: ClassInfo, header_path: str) -> str:
+    """Generiert die C++ _registration.h Header-Datei."""
+    return _get_template("registration_header.h.j2").render(
         cls=cls,
         header_path=Path(header_path).name,
     )
@@ -100,12 +170,7 @@ def generate_registration_header(cls: ClassInfo, header_path: str) -> str:
 
 def generate_registration_impl(cls: ClassInfo, header_path: str) -> str:
     """Generiert die C++ _registration.cpp Implementierungs-Datei."""
-    try:
-        template = _JINJA_ENV.get_template("registration_impl.cpp.j2")
-    except Exception as e:
-        raise FileNotFoundError(f"Konnte Template 'registration_impl.cpp.j2' nicht laden: {e}") from e
-
-    return template.render(
+    return _get_template("registration_impl.cpp.j2").render(
         cls=cls,
         header_path=Path(header_path).name,
     )
@@ -113,12 +178,7 @@ def generate_registration_impl(cls: ClassInfo, header_path: str) -> str:
 
 def generate_typescript_impl(cls: ClassInfo, header_path: str) -> str:
     """Generiert die TypeScript .ts Implementierung."""
-    try:
-        template = _JINJA_ENV.get_template("impl.ts.j2")
-    except Exception as e:
-        raise FileNotFoundError(f"Konnte Template 'impl.ts.j2' nicht laden: {e}") from e
-
-    return template.render(
+    return _get_template("impl.ts.j2").render(
         cls=cls,
         header_path=Path(header_path).name,
     )
@@ -126,17 +186,103 @@ def generate_typescript_impl(cls: ClassInfo, header_path: str) -> str:
 
 def generate_typescript_types(cls: ClassInfo, header_path: str) -> str:
     """Generiert die TypeScript .types.d.ts Type Definitionen."""
-    try:
-        template = _JINJA_ENV.get_template("types.d.ts.j2")
-    except Exception as e:
-        raise FileNotFoundError(f"Konnte Template 'types.d.ts.j2' nicht laden: {e}") from e
-
-    return template.render(
+    return _get_template("types.d.ts.j2").render(
         cls=cls,
         header_path=Path(header_path).name,
     )
 
 
+def _write_outputs(cls: ClassInfo, input_path: str, args: argparse.Namespace) -> List[Path]:
+    """Schreibt alle angeforderten Ausgabedateien für eine Klasse.
+
+    Returns:
+        Pfade aller (geschriebenen oder unveränderten) Ausgabedateien
+    """
+    outputs: List[Path] = []
+    # C++ Registration generieren (falls --cpp_out angegeben)
+    if args.cpp_out:
+        cpp_out_path = Path(args.cpp_out)
+        cpp_out_path.mkdir(parents=True, exist_ok=True)
+        
+        # Header generieren
+        reg_header_output = cpp_out_path / f"{cls.name}_registration.h"
+        written = _render_to_file("registration_header.h.j2", cls, input_path, reg_header_output)
+        if args.verbose:
+            print(f"    [OK] {'Generiert' if written else 'Unverändert'}: {reg_header_output}")
+        outputs.append(reg_header_output)
+        
+        # Implementation generieren
+        reg_impl_output = cpp_out_path / f"{cls.name}_registration.cpp"
+        written = _render_to_file("registration_impl.cpp.j2", cls, input_path, reg_impl_output)
+        if args.verbose:
+            print(f"    [OK] {'Generiert' if written else 'Unverändert'}: {reg_impl_output}")
+        outputs.append(reg_impl_output)
+
+    # TypeScript Implementierung generieren (falls --ts_impl_out angegeben)
+    if args.ts_impl_out:
+        ts_impl_out_path = Path(args.ts_impl_out)
+        ts_impl_out_path.mkdir(parents=True, exist_ok=True)
+        ts_impl_output = ts_impl_out_path / f"{cls.name}.ts"
+        written = _render_to_file("impl.ts.j2", cls, input_path, ts_impl_output)
+        if args.verbose:
+            print(f"    [OK] {'Generiert' if written else 'Unverändert'}: {ts_impl_output}")
+        outputs.append(ts_impl_output)
+
+    return outputs
+
+
+# =============================================================================
+# Server-Modus
+# =============================================================================
+
+def _run_server(args: argparse.Namespace):
+    """
+    Langlebiger Server-Modus: verarbeitet Jobs von stdin, bis stdin geschlossen wird.
+
+    Interpreter-Start, tree-sitter und Jinja-Environment werden so nur einmal
+    für beliebig viele Jobs bezahlt.
+
+    Job (eine JSON-Zeile):
+        {"header": "file.h", "class": "ClassName", "cpp_out": "...", "ts_impl_out": "..."}
+        cpp_out/ts_impl_out sind optional und fallen auf die Kommandozeile zurück.
+
+    Antwort (eine JSON-Zeile pro Job):
+        {"status": "ok", "header": ..., "class": ..., "paths": [...]}
+        {"status": "error", "header": ..., "class": ..., "message": "..."}
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        response = {}
+        try:
+            job = json.loads(line)
+            header = job['header']
+            class_name = job['class']
+            response['header'] = header
+            response['class'] = class_name
+
+            job_args = argparse.Namespace(
+                cpp_out=job.get('cpp_out', args.cpp_out),
+                ts_impl_out=job.get('ts_impl_out', args.ts_impl_out),
+                verbose=False,  # stdout gehört dem Protokoll
+            )
+            if not job_args.cpp_out and not job_args.ts_impl_out:
+                raise ValueError("Mindestens cpp_out oder ts_impl_out muss angegeben werden")
+
+            cls = parse_header_all(header, [class_name]).get(class_name)
+            if not cls:
+                raise LookupError(f"Klasse '{class_name}' nicht gefunden in {header}")
+
+            paths = _write_outputs(cls, header, job_args)
+            response.update(status='ok', paths=[str(path) for path in paths])
+        except Exception as e:
+            response.update(status='error', message=str(e))
+
+        print(json.dumps(response), flush=True)
+
+
 # =============================================================================
 # Main
 # =============================================================================
@@ -145,14 +291,20 @@ def main():
     """
     Hauptfunktion für die Registrierungs-Generierung.
 
-    Unterstützt zwei Modi:
+    Unterstützt drei Modi:
     1. Einzelne Datei: python generate.py <file.h> --class-name <Name>
     2. Batch: python generate.py --batch file1.h:Class1 file2.h:Class2 ...
+    3. Server: python generate.py --server (JSON-Jobs zeilenweise über stdin)
+
+    Jede Header-Datei wird genau einmal geparst, auch wenn sie mehrere
+    der angeforderten Klassen enthält.
 
     Args:
         input_path: Eingabe-Header-Datei (.h) [Einzelmodus]
         batch: Liste von "file.h:ClassName" Paaren [Batch-Modus]
+        server: Jobs von stdin lesen [Server-Modus]
         class_name: Name der zu verarbeitenden Klasse [Einzelmodus]
+        classes: Kommagetrennte Klassennamen [Einzelmodus]
         cpp_out: Ausgabe-Ordner für C++ Registration (optional)
         ts_impl_out: Ausgabe-Ordner für TypeScript Implementierung (optional)
         verbose: Detaillierte Ausgaben
@@ -168,18 +320,28 @@ def main():
     )
     parser.add_argument('input_path', nargs='?', help='Eingabe-Header-Datei (.h) [Einzelmodus]')
     parser.add_argument('--class-name', help='Name der zu verarbeitenden Klasse [Einzelmodus]')
+    parser.add_argument('--classes', help='Kommagetrennte Klassennamen aus input_path [Einzelmodus]')
     parser.add_argument('--batch', nargs='+', metavar='FILE|CLASS', 
                         help='Batch-Modus: Liste von "file.h|ClassName" Paaren')
+    parser.add_argument('--server', action='store_true',
+                        help='Server-Modus: JSON-Jobs zeilenweise von stdin lesen')
     parser.add_argument('--cpp_out', type=str, help='Ausgabe-Ordner für C++ Registration Header')
     parser.add_argument('--ts_impl_out', type=str, help='Ausgabe-Ordner für TypeScript Implementierung')
     parser.add_argument('--verbose', '-v', action='store_true', help='Zeige detaillierte Ausgaben')
 
     args = parser.parse_args()
 
+    if args.server:
+        if args.batch or args.input_path or args.class_name or args.classes:
+            print("Fehler: Im Server-Modus werden Jobs ausschließlich über stdin übergeben", file=sys.stderr)
+            sys.exit(1)
+        _run_server(args)
+        return
+
     # Validierung: Entweder Einzelmodus oder Batch-Modus
     if args.batch:
-        if args.input_path or args.class_name:
-            print("Fehler: Im Batch-Modus dürfen input_path und --class-name nicht verwendet werden", file=sys.stderr)
+        if args.input_path or args.class_name or args.classes:
+            print("Fehler: Im Batch-Modus dürfen input_path, --class-name und --classes nicht verwendet werden", file=sys.stderr)
             sys.exit(1)
         # Batch-Modus: Parse alle file|class Paare
         file_class_pairs = []
@@ -193,95 +355,77 @@ def main():
                 sys.exit(1)
             file_class_pairs.append((file_path, class_name))
     else:
-        # Einzelmodus: Benötigt input_path und class_name
-        if not args.input_path or not args.class_name:
-            print("Fehler: Im Einzelmodus sind input_path und --class-name erforderlich", file=sys.stderr)
+        # Einzelmodus: Benötigt input_path und class_name (oder classes)
+        if not args.input_path or not (args.class_name or args.classes):
+            print("Fehler: Im Einzelmodus sind input_path und --class-name (oder --classes) erforderlich", file=sys.stderr)
             print("       Oder verwende --batch für mehrere Dateien", file=sys.stderr)
             sys.exit(1)
         if not Path(args.input_path).exists():
             print(f"Fehler: Datei nicht gefunden: {args.input_path}", file=sys.stderr)
             sys.exit(1)
-        file_class_pairs = [(args.input_path, args.class_name)]
+        class_names = [args.class_name] if args.class_name else []
+        if args.classes:
+            class_names += [name.strip() for name in args.classes.split(',') if name.strip()]
+        # z.B. --classes "," aus einer leeren CMake-Liste: nichts zu tun ist ein Fehler, kein Erfolg
+        if not class_names:
+            print(f"Fehler: --classes enthält keinen Klassennamen: '{args.classes}'", file=sys.stderr)
+            sys.exit(1)
+        file_class_pairs = [(args.input_path, name) for name in class_names]
 
     if not args.cpp_out and not args.ts_impl_out:
         print("Fehler: Mindestens --cpp_out oder --ts_impl_out muss angegeben werden", file=sys.stderr)
         sys.exit(1)
 
+    # Gruppiere Klassen nach Header-Datei, damit jede Datei nur einmal geparst wird
+    classes_by_file: Dict[str, List[str]] = {}
+    for input_path, class_name in file_class_pairs:
+        classes_by_file.setdefault(input_path, []).append(class_name)
+
     # Verarbeite alle Datei/Klassen-Paare
     success_count = 0
     error_count = 0
     
-    for input_path, class_name in file_class_pairs:
+    for input_path, class_names in classes_by_file.items():
         if args.verbose:
-            print(f"Parsing: {input_path} -> {class_name}")
+            print(f"Parsing: {input_path} -> {', '.join(class_names)}")
 
         try:
-            cls = parse_header(input_path, class_name)
+            parsed_classes = parse_header_all(input_path, class_names)
         except ImportError as e:
             print(f"  [ERROR] webbridge_parser nicht verfügbar: {e}", file=sys.stderr)
-            error_count += 1
+            error_count += len(class_names)
             continue
         except Exception as e:
             print(f"  [ERROR] Fehler beim Parsen: {e}", file=sys.stderr)
             if args.verbose:
                 import traceback
                 traceback.print_exc()
-            error_count += 1
-            continue
-
-        if not cls:
-            print(f"  [ERROR] Klasse '{class_name}' nicht gefunden in {input_path}", file=sys.stderr)
-            error_count += 1
+            error_count += len(class_names)
             continue
 
-        if args.verbose:
-            print(f"  [OK] Klasse gefunden: {cls.name}")
-            print(f"    - Properties: {len(cls.properties)} {[p.name for p in cls.properties]}")
-            print(f"    - Events: {len(cls.events)} {[e.name for e in cls.events]}")
-            print(f"    - Sync Methods: {len(cls.sync_methods)} {[m.name for m in cls.sync_methods]}")
-            print(f"    - Async Methods: {len(cls.async_methods)} {[m.name for m in cls.async_methods]}")
-
-        try:
-            # C++ Registration generieren (falls --cpp_out angegeben)
-            if args.cpp_out:
-                cpp_out_path = Path(args.cpp_out)
-                cpp_out_path.mkdir(parents=True, exist_ok=True)
-                
-                # Header generieren
-                reg_header_output = cpp_out_path / f"{cls.name}_registration.h"
-                reg_header_code = generate_registration_header(cls, input_path)
-                with open(reg_header_output, 'w', encoding='utf-8') as f:
-                    f.write(reg_header_code)
-                if args.verbose:
-                    print(f"    [OK] Generiert: {reg_header_output}")
-                
-                # Implementation generieren
-                reg_impl_output = cpp_out_path / f"{cls.name}_registration.cpp"
-                reg_impl_code = generate_registration_impl(cls, input_path)
-                with open(reg_impl_output, 'w', encoding='utf-8') as f:
-                    f.write(reg_impl_code)
-                if args.verbose:
-                    print(f"    [OK] Generiert: {reg_impl_output}")
-
-            # TypeScript Implementierung generieren (falls --ts_impl_out angegeben)
-            if args.ts_impl_out:
-                ts_impl_out_path = Path(args.ts_impl_out)
-                ts_impl_out_path.mkdir(parents=True, exist_ok=True)
-                ts_impl_output = ts_impl_out_path / f"{cls.name}.ts"
-                ts_impl_code = generate_typescript_impl(cls, input_path)
-                with open(ts_impl_output, 'w', encoding='utf-8') as f:
-                    f.write(ts_impl_code)
-                if args.verbose:
-                    print(f"    [OK] Generiert: {ts_impl_output}")
-                    
-            success_count += 1
+        for class_name in class_names:
+            cls = parsed_classes.get(class_name)
+            if not cls:
+                print(f"  [ERROR] Klasse '{class_name}' nicht gefunden in {input_path}", file=sys.stderr)
+                error_count += 1
+                continue
 
-        except Exception as e:
-            print(f"    [ERROR] Fehler bei {cls.name}: {e}", file=sys.stderr)
             if args.verbose:
-                import traceback
-                traceback.print_exc()
-            error_count += 1
+                print(f"  [OK] Klasse gefunden: {cls.name}")
+                print(f"    - Properties: {len(cls.properties)} {[p.name for p in cls.properties]}")
+                print(f"    - Events: {len(cls.events)} {[e.name for e in cls.events]}")
+                print(f"    - Sync Methods: {len(cls.sync_methods)} {[m.name for m in cls.sync_methods]}")
+                print(f"    - Async Methods: {len(cls.async_methods)} {[m.name for m in cls.async_methods]}")
+
+            try:
+                _write_outputs(cls, input_path, args)
+                success_count += 1
+            except Exception as e:
+                print(f"    [ERROR] Fehler bei {cls.name}: {e}", file=sys.stderr)
+                if args.verbose:
+                    import traceback
+                    traceback.print_exc()
+                error_count += 1
 
     # Zusammenfassung (nur im nicht-verbose Modus und bei Batch)
     if not args.verbose and len(file_class_pairs) > 1:
@@ -7,49 +7,65 @@ Extracts properties, events, and methods from explicitly specified classes.
 
 Note on Implementation:
     Tree-sitter provides a powerful query API using S-expressions
-    (see https://tree-sitter.github.io/tree-sitter/using-parsers/queries/1-syntax.html)
-    which would allow declarative pattern matching like:
-    
+    (see https://tree-sitter.github.io/tree-sitter/using-parsers/queries/1-syntax.html).
+    With the tree-sitter 0.25 bindings (Query + QueryCursor) this works
+    reliably, so the members of a class body are enumerated by one
+    precompiled query (_MEMBER_QUERY) that also captures property/event
+    fields directly:
+
         (field_declaration
-          (template_type name: (type_identifier) @template_name)
-          declarator: (field_identifier) @member_name)
-    
-    However, the Python bindings for tree-sitter queries were not working reliably
-    in our testing environment. Therefore, this module uses manual AST traversal
-    instead. While more verbose, this approach provides full control over the
-    parsing logic and handles edge cases more explicitly.
+          type: (template_type name: (type_identifier) @template ...)
+          declarator: (field_identifier) @name)
+
+    Class lookup at file/namespace scope and the details of methods,
+    constants and enums still use manual AST traversal, which keeps full
+    control over the edge cases.
 
 Requirements:
     pip install tree-sitter tree-sitter-cpp
 """
 
+import functools
+import io
+import os
+import re
 import sys
+import mmap
+import pickle
 from pathlib import Path
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Optional, Tuple
 import tree_sitter_cpp as tscpp
-from tree_sitter import Language, Parser, Node
+from tree_sitter import Language, Node, Parser, Query, QueryCursor, Tree
+import _ast_cache
+
+
+# Language and parser are created once per process and reused
+# (tree-sitter parsers are not thread-safe; every process owns its instances)
+_LANGUAGE = Language(tscpp.language())
+_PARSER = Parser(_LANGUAGE)
 
 
 # =============================================================================
 # Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PropertyInfo:
     """Information about a Property<T> member."""
     name: str
     type_name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EventInfo:
     """Information about an Event<Args...> member."""
     name: str
     arg_types: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstInfo:
     """Information about a constant member."""
     name: str
@@ -57,7 +73,7 @@ class ConstInfo:
     is_static: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class EnumInfo:
     """Information about an enum definition."""
     name: str
@@ -66,16 +82,17 @@ class EnumInfo:
     is_nested: bool = True  # True if defined inside the class
 
 
-@dataclass
+@dataclass(slots=True)
 class MethodInfo:
     """Information about a method."""
     name: str
     return_type: str
     parameters: List[Tuple[str, str]]
     is_async: bool = False
+    signature: str = ''  # "type name, type name" of the parameters, built once at extraction
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassInfo:
     """Collected information about a C++ class."""
     name: str
@@ -135,9 +152,99 @@ class ClassInfo:
 # Helper Functions
 # =============================================================================
 
+# Node types ignored while normalizing a type
+_TYPE_SKIP_NODES = frozenset({'comment', 'initializer_list', 'argument_list'})
+
+# Type text containing these bytes (comments, initializers, argument lists,
+# literals) needs the node-based normalization
+_TYPE_FALLBACK_RE = re.compile(rb'[{(/"\']')
+
+# Whitespace between two alphanumeric characters collapses to one space,
+# any other whitespace is dropped (same rule as the node-based join)
+_TYPE_SPACE_RE = re.compile(r'(?<=[^\W_])(\s+)(?=[^\W_])|\s+')
+
+# Bytes that continue an identifier/number (UTF-8 lead/continuation bytes count as letters)
+_WORD_BYTES = frozenset(b for b in range(256) if b >= 0x80 or chr(b).isalnum())
+
+
+# Member node types handled by _extract_all_members
+_MEMBER_TYPES = frozenset({'field_declaration', 'function_definition', 'enum_specifier'})
+
+# Parameter type nodes that are extracted (others yield 'unknown' and are skipped)
+_PARAM_TYPE_NODES = frozenset({'primitive_type', 'type_identifier', 'qualified_identifier', 'template_type'})
+_PARAM_DECLARATOR_NODES = frozenset({'identifier', 'reference_declarator', 'pointer_declarator'})
+
+# Method name nodes (inline definitions may also use plain identifiers)
+_METHOD_NAME_NODES = frozenset({'field_identifier'})
+_INLINE_METHOD_NAME_NODES = frozenset({'field_identifier', 'identifier'})
+
+# Children skipped when looking for the return type of a method
+_INLINE_RETURN_SKIP = frozenset({'function_declarator', 'compound_statement', 'type_qualifier'})
+_DECL_RETURN_SKIP = frozenset({'attribute_declaration', 'field_identifier', 'function_declarator', ';'})
+
+# Type nodes of constants
+_CONST_TYPE_NODES = frozenset({'primitive_type', 'type_identifier', 'qualified_identifier', 'sized_type_specifier'})
+
+# Template names of webbridge members (old PascalCase and new snake_case)
+_PROPERTY_TEMPLATES = frozenset({'Property', 'property'})
+_EVENT_TEMPLATES = frozenset({'Event', 'event'})
+
+# Single node types for child lookups
+_IDENTIFIER = frozenset({'identifier'})
+_TYPE_IDENTIFIER = frozenset({'type_identifier'})
+_TYPE_DESCRIPTOR = frozenset({'type_descriptor'})
+_PARAMETER_LIST = frozenset({'parameter_list'})
+_FUNCTION_DECLARATOR = frozenset({'function_declarator'})
+
+# Subtrees below a class body that never contain members of the class itself:
+# inline method definitions (declarator is handled by _parse_method), bodies
+# and initializers (e.g. lambdas) and the bodies of nested classes
+_MEMBER_PRUNE_TYPES = frozenset({
+    'function_definition', 'compound_statement', 'field_initializer_list',
+    'initializer_list', 'lambda_expression', 'field_declaration_list',
+})
+
+# Class body query with two patterns:
+#  1. property<T>/event<Args...> fields, template name/arguments/member name
+#     captured in C (supports both old PascalCase and new snake_case)
+#  2. access specifiers, members and pruned subtrees in document order (@node)
+_MEMBER_QUERY = Query(
+    _LANGUAGE,
+    '(field_declaration'
+    ' type: (template_type name: (type_identifier) @template arguments: (template_argument_list) @args)'
+    ' declarator: (field_identifier) @name'
+    ' (#any-of? @template ' + ' '.join(f'"{name}"' for name in sorted(_PROPERTY_TEMPLATES | _EVENT_TEMPLATES)) + '))'
+    ' @template_member\n'
+    '[' + ' '.join(f'({node_type})' for node_type in
+                   sorted(_MEMBER_TYPES | _MEMBER_PRUNE_TYPES | {'access_specifier'})) + '] @node'
+)
+
+# Nodes at file/namespace scope that may contain class definitions
+_SCOPE_CONTAINERS = frozenset({
+    'translation_unit', 'declaration_list', 'declaration', 'template_declaration',
+    'linkage_specification', 'preproc_if', 'preproc_ifdef', 'preproc_else', 'preproc_elif',
+})
+
+# Keyword tokens compared on raw bytes (no decoding needed)
+_CONST_TOKENS = frozenset({b'const', b'constexpr'})
+_STATIC_TOKEN = b'static'
+_CLASS_TOKEN = b'class'
+_ASYNC_ATTR = b'async'
+_ACCESS_TOKENS = ((b'public', 'public'), (b'private', 'private'), (b'protected', 'protected'))
+
+
 def _get_node_text(source_code: bytes, node: Node) -> str:
-    """Extract the text content of an AST node."""
-    return source_code[node.start_byte:node.end_byte].decode('utf-8')
+    """Extract the text content of an AST node (interned, names repeat a lot)."""
+    return sys.intern(source_code[node.start_byte:node.end_byte].decode('utf-8'))
+
+
+def _node_bytes(source_code: bytes, node: Node) -> bytes:
+    """Extract the raw bytes of an AST node (for keyword checks)."""
+    return source_code[node.start_byte:node.end_byte]
+
+
+def _collapse_space(match: re.Match) -> str:
+    return ' ' if match.group(1) else ''
 
 
 def _normalize_type(source_code: bytes, node: Node) -> str:
@@ -145,40 +252,70 @@ def _normalize_type(source_code: bytes, node: Node) -> str:
     if node.type == 'comment' or not node:
         return ''
 
+    # Fast path: plain type text only needs whitespace normalization.
+    normalized = _normalize_type_text(source_code[node.start_byte:node.end_byte])
+    if normalized is not None:
+        return normalized
+
+    return sys.intern(_normalize_type_nodes(source_code, node))
+
+
+# Bounded, so the --server mode of generate.py does not grow it without limit across jobs.
+# Repeated spellings (int, bool, std::string, ...) share one str object.
+@functools.lru_cache(maxsize=4096)
+def _normalize_type_text(text: bytes) -> Optional[str]:
+    """Normalize raw type text, or return None if it needs the node-based path."""
+    if _TYPE_FALLBACK_RE.search(text) is not None:
+        return None
+    return sys.intern(_TYPE_SPACE_RE.sub(_collapse_space, text.decode('utf-8')))
+
+
+def _normalize_type_nodes(source_code: bytes, node: Node) -> str:
+    """Normalize type text by joining the leaf nodes of the type."""
     if not node.children:
         return _get_node_text(source_code, node).strip()
 
-    parts = []
-    prev_needs_space = False
+    out = bytearray()
 
-    for child in node.children:
-        if child.type in ('comment', 'initializer_list', 'argument_list'):
+    # Iterative depth-first walk: one child iterator per open level
+    stack = [iter(node.children)]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+            continue
+        if child.type in _TYPE_SKIP_NODES:
+            continue
+        # '{' beendet die aktuelle Ebene (Initializer)
+        if child.end_byte - child.start_byte == 1 and source_code[child.start_byte] == 0x7B:
+            stack.pop()
+            continue
+        if child.children:
+            stack.append(iter(child.children))
             continue
-        if _get_node_text(source_code, child) == '{':
-            break
 
-        text = _normalize_type(source_code, child)
+        text = source_code[child.start_byte:child.end_byte].strip()
         if text:
-            if parts and prev_needs_space and text[0].isalnum():
-                parts.append(' ')
-            parts.append(text)
-            prev_needs_space = text[-1].isalnum()
+            # Leerzeichen nur zwischen zwei Wort-Zeichen (z.B. "unsigned int")
+            if out and out[-1] in _WORD_BYTES and text[0] in _WORD_BYTES:
+                out += b' '
+            out += text
 
-    return ''.join(parts)
+    return out.decode('utf-8')
 
 
-def _find_child_by_type(node: Node, *types) -> Optional[Node]:
+def _find_child_by_type(node: Node, types: AbstractSet[str]) -> Optional[Node]:
     """Find the first child node matching any of the given types."""
-    return next((child for child in node.children if child.type in types), None)
-
+    for child in node.children:
+        if child.type in types:
+            return child
+    return None
 
-def _extract_template_info(source_code: bytes, type_node: Node) -> Tuple[Optional[str], Optional[Node]]:
-    """Extract template name and template argument list from a template type node."""
-    template_name_node = _find_child_by_type(type_node, 'type_identifier')
-    template_args = _find_child_by_type(type_node, 'template_argument_list')
 
-    template_name = _get_node_text(source_code, template_name_node) if template_name_node else None
-    return template_name, template_args
+def _field_child(node: Node, field_name: str, types: AbstractSet[str]) -> Optional[Node]:
+    """Return the child in the given grammar field if it has one of the given types."""
+    child = node.child_by_field_name(field_name)
+    return child if child is not None and child.type in types else None
 
 
 def _parse_parameters(source_code: bytes, param_list: Node) -> List[Tuple[str, str]]:
@@ -190,22 +327,20 @@ def _parse_parameters(source_code: bytes, param_list: Node) -> List[Tuple[str, s
             continue
 
         # Extrahiere Type
-        type_node = _find_child_by_type(child, 'primitive_type', 'type_identifier', 'qualified_identifier', 'template_type')
+        type_node = _field_child(child, 'type', _PARAM_TYPE_NODES)
         param_type = _normalize_type(source_code, type_node) if type_node else 'unknown'
 
         # Extrahiere Name
         param_name = 'arg'
-        for node_type in ('identifier', 'reference_declarator', 'pointer_declarator'):
-            name_node = _find_child_by_type(child, node_type)
-            if name_node:
-                if node_type == 'identifier':
-                    param_name = _get_node_text(source_code, name_node)
-                else:
-                    # Für reference/pointer: suche Identifier in Kindern
-                    identifier = _find_child_by_type(name_node, 'identifier')
-                    if identifier:
-                        param_name = _get_node_text(source_code, identifier)
-                break
+        name_node = _field_child(child, 'declarator', _PARAM_DECLARATOR_NODES)
+        if name_node:
+            if name_node.type == 'identifier':
+                param_name = _get_node_text(source_code, name_node)
+            else:
+                # Für reference/pointer: suche Identifier in Kindern
+                identifier = _find_child_by_type(name_node, _IDENTIFIER)
+                if identifier:
+                    param_name = _get_node_text(source_code, identifier)
 
         if param_type != 'unknown':
             parameters.append((param_type, param_name))
@@ -214,207 +349,228 @@ def _parse_parameters(source_code: bytes, param_list: Node) -> List[Tuple[str, s
 
 
 def _parse_method(source_code: bytes, node: Node, func_declarator: Node, 
-                  class_name: str, is_inline: bool = False) -> Optional[MethodInfo]:
+                  class_name_bytes: bytes, is_inline: bool = False) -> Optional[Tuple[MethodInfo, bool]]:
     """Parse a method from either function_definition or field_declaration.
     
     Returns None if the node should be skipped (destructor, operator, etc.).
     Returns a tuple (method_info, is_constructor) otherwise.
     """
-    name_types = ('field_identifier', 'identifier') if is_inline else ('field_identifier',)
-    method_name_node = _find_child_by_type(func_declarator, *name_types)
-    params_node = _find_child_by_type(func_declarator, 'parameter_list')
+    name_types = _INLINE_METHOD_NAME_NODES if is_inline else _METHOD_NAME_NODES
+    method_name_node = _field_child(func_declarator, 'declarator', name_types)
+    params_node = _field_child(func_declarator, 'parameters', _PARAMETER_LIST)
     
     if not (method_name_node and params_node):
         return None
     
-    method_name = _get_node_text(source_code, method_name_node)
+    name_bytes = _node_bytes(source_code, method_name_node)
     
     # Skip destructors and operators
-    if method_name.startswith(('~', 'operator')):
+    if name_bytes.startswith((b'~', b'operator')):
         return None
     
-    is_constructor = (method_name == class_name)
+    is_constructor = (name_bytes == class_name_bytes)
     
     # Determine return type based on node type
     if is_constructor:
         return_type = ''
-    elif is_inline:
-        # For function_definition: return type is before function_declarator
-        skip_types = ('function_declarator', 'compound_statement', 'type_qualifier')
-        return_type_node = next((c for c in node.children if c.type not in skip_types), None)
-        return_type = _normalize_type(source_code, return_type_node) if return_type_node else 'void'
     else:
-        # For field_declaration: skip attributes and declarators
-        skip_types = ('attribute_declaration', 'field_identifier', 'function_declarator', ';')
-        return_type_node = next((c for c in node.children if c.type not in skip_types), None)
-        return_type = _normalize_type(source_code, return_type_node) if return_type_node else 'void'
+        # function_definition: return type is before function_declarator,
+        # field_declaration: skip attributes and declarators
+        skip_types = _INLINE_RETURN_SKIP if is_inline else _DECL_RETURN_SKIP
+        return_type = 'void'
+        for child in node.children:
+            if child.type not in skip_types:
+                return_type = _normalize_type(source_code, child)
+                break
     
-    # Check for async attribute (only in field_declaration, not inline)
+    # Check for async attribute (only in field_declaration, not inline).
+    # Most declarations don't mention 'async' at all: one substring test on
+    # the whole declaration avoids scanning the children in that case.
     is_async = False
-    if not is_inline:
-        is_async = any('async' in _get_node_text(source_code, child)
+    if not is_inline and _ASYNC_ATTR in _node_bytes(source_code, node):
+        is_async = any(_ASYNC_ATTR in _node_bytes(source_code, child)
                        for child in node.children if child.type == 'attribute_declaration')
     
-    return MethodInfo(
-        name=method_name,
+    parameters = _parse_parameters(source_code, params_node)
+    method_info = MethodInfo(
+        name=name_bytes.decode('utf-8'),
         return_type=return_type,
-        parameters=_parse_parameters(source_code, params_node),
-        is_async=is_async
+        parameters=parameters,
+        is_async=is_async,
+        signature=', '.join(f'{t} {n}' for t, n in parameters)
     )
+    return method_info, is_constructor
 
 
-def _extract_all_members(source_code: bytes, class_body: Node, class_info: ClassInfo):
-    """Extract all members (properties, events, methods) in a single pass."""
+def _add_method(class_info: ClassInfo, parsed: Optional[Tuple[MethodInfo, bool]]):
+    """Sort a parsed method into constructors, async or sync methods."""
+    if not parsed:
+        return
+    method, is_constructor = parsed
+    if is_constructor:
+        class_info.constructors.append(method)
+    elif method.is_async:
+        class_info.async_methods.append(method)
+    else:
+        class_info.sync_methods.append(method)
 
-    current_access = 'private'  # Default access in class is private
 
-    def process_field(node: Node, access: str):
-        if node.type not in ('field_declaration', 'function_definition', 'enum_specifier'):
-            return
+def _handle_enum(source_code: bytes, node: Node, class_info: ClassInfo, class_name_bytes: bytes):
+    """Handle an enum_specifier member."""
+    is_enum_class = False
+    enum_name = None
+    enumerator_list = None
 
-        # Ignore non-public members
-        if access != 'public':
-            return
+    for child in node.children:
+        if _node_bytes(source_code, child) == _CLASS_TOKEN:
+            is_enum_class = True
+        elif child.type == 'type_identifier':
+            enum_name = _get_node_text(source_code, child)
+        elif child.type == 'enumerator_list':
+            enumerator_list = child
+
+    # Extract enum values
+    enum_values = []
+    if enumerator_list:
+        for child in enumerator_list.children:
+            if child.type == 'enumerator':
+                identifier = _find_child_by_type(child, _IDENTIFIER)
+                if identifier:
+                    enum_values.append(_get_node_text(source_code, identifier))
+
+    class_info.enums.append(EnumInfo(
+        name=enum_name or '<anonymous>',
+        enum_values=enum_values,
+        is_enum_class=is_enum_class
+    ))
+
+
+def _handle_function_definition(source_code: bytes, node: Node, class_info: ClassInfo, class_name_bytes: bytes):
+    """Handle a function_definition member (inline method with body)."""
+    func_declarator = _field_child(node, 'declarator', _FUNCTION_DECLARATOR)
+    if func_declarator:
+        _add_method(class_info, _parse_method(source_code, node, func_declarator, class_name_bytes, is_inline=True))
+
+
+def _handle_field_declaration(source_code: bytes, node: Node, class_info: ClassInfo, class_name_bytes: bytes):
+    """Handle a field_declaration member (method declaration, property, event, or constant)."""
+    declarator = node.child_by_field_name('declarator')
+    if declarator is None:
+        return
+
+    if declarator.type == 'function_declarator':
+        _add_method(class_info, _parse_method(source_code, node, declarator, class_name_bytes, is_inline=False))
+        return
+
+    # Properties/Events kommen bereits aus der Query (_handle_template_member),
+    # hier bleibt nur die Prüfung auf eine Konstante
+    if declarator.type != 'field_identifier':
+        return
+    declarator_node = declarator
+
+    has_const = False
+    is_static = False
+    actual_type_node = None
 
-        # Handle enum_specifier
-        if node.type == 'enum_specifier':
-            is_enum_class = False
-            enum_name = None
-            enumerator_list = None
-
-            for child in node.children:
-                text = _get_node_text(source_code, child)
-                if text == 'class':
-                    is_enum_class = True
-                elif child.type == 'type_identifier':
-                    enum_name = text
-                elif child.type == 'enumerator_list':
-                    enumerator_list = child
-
-            # Extract enum values
-            enum_values = []
-            if enumerator_list:
-                for child in enumerator_list.children:
-                    if child.type == 'enumerator':
-                        identifier = _find_child_by_type(child, 'identifier')
-                        if identifier:
-                            enum_values.append(_get_node_text(source_code, identifier))
-
-            class_info.enums.append(EnumInfo(
-                name=enum_name or '<anonymous>',
-                enum_values=enum_values,
-                is_enum_class=is_enum_class
-            ))
-            return
+    for child in node.children:
+        text = _node_bytes(source_code, child)
+        if text in _CONST_TOKENS:
+            has_const = True
+        elif child.type == 'type_qualifier' and b'const' in text:
+            has_const = True
+        elif text == _STATIC_TOKEN:
+            is_static = True
+        elif child.type in _CONST_TYPE_NODES:
+            actual_type_node = child
+
+    if has_const and actual_type_node:
+        class_info.constants.append(ConstInfo(
+            name=_get_node_text(source_code, declarator_node),
+            type_name=_normalize_type(source_code, actual_type_node),
+            is_static=is_static
+        ))
 
-        # Handle function_definition (inline method with body)
-        if node.type == 'function_definition':
-            func_declarator = _find_child_by_type(node, 'function_declarator')
-            if not func_declarator:
-                return
-            
-            method = _parse_method(source_code, node, func_declarator, class_info.name, is_inline=True)
-            if method:
-                if method.name == class_info.name:
-                    class_info.constructors.append(method)
-                else:
-                    class_info.sync_methods.append(method)
-            return
 
-        # Handle field_declaration (could be method declaration, property, event, or constant)
-        func_declarator = _find_child_by_type(node, 'function_declarator')
-
-        if func_declarator:
-            method = _parse_method(source_code, node, func_declarator, class_info.name, is_inline=False)
-            if method:
-                if method.name == class_info.name:
-                    class_info.constructors.append(method)
-                elif method.is_async:
-                    class_info.async_methods.append(method)
-                else:
-                    class_info.sync_methods.append(method)
-            return
+def _handle_template_member(source_code: bytes, captures: Dict[str, List[Node]], class_info: ClassInfo):
+    """Handle a property<T>/event<Args...> field from a _MEMBER_QUERY match."""
+    template_name = _get_node_text(source_code, captures['template'][0])
+    template_args = captures['args'][0]
+    member_name = _get_node_text(source_code, captures['name'][0])
 
-        # Sonst ist es Property, Event oder Konstante
-        type_node = _find_child_by_type(node, 'template_type')
-        declarator_node = _find_child_by_type(node, 'field_identifier')
-
-        # Wenn es ein template_type ist, prüfe auf Property/Event
-        if type_node and declarator_node:
-            template_name, template_args = _extract_template_info(source_code, type_node)
-            member_name = _get_node_text(source_code, declarator_node)
-
-            # Property oder Event? (supports both old PascalCase and new snake_case)
-            if template_name in ('Property', 'property'):
-                prop_type = 'unknown'
-                if template_args:
-                    type_desc = _find_child_by_type(template_args, 'type_descriptor')
-                    if type_desc:
-                        prop_type = _normalize_type(source_code, type_desc)
-                class_info.properties.append(PropertyInfo(name=member_name, type_name=prop_type))
-                return
-
-            elif template_name in ('Event', 'event'):
-                arg_types = []
-                if template_args:
-                    arg_types = [_normalize_type(source_code, child)
-                               for child in template_args.children
-                               if child.type == 'type_descriptor']
-                class_info.events.append(EventInfo(name=member_name, arg_types=arg_types))
-                return
-        
-        # Wenn nicht Property/Event, prüfe ob es eine Konstante ist
-        if declarator_node:
-            has_const = False
-            is_static = False
-            actual_type_node = None
-            
-            for child in node.children:
-                text = _get_node_text(source_code, child)
-                if text == 'const' or text == 'constexpr':
-                    has_const = True
-                elif child.type == 'type_qualifier' and ('const' in text or 'constexpr' in text):
-                    has_const = True
-                elif text == 'static':
-                    is_static = True
-                elif child.type in ('primitive_type', 'type_identifier', 'qualified_identifier', 'sized_type_specifier'):
-                    actual_type_node = child
-            
-            if has_const and actual_type_node and declarator_node:
-                const_type = _normalize_type(source_code, actual_type_node)
-                const_name = _get_node_text(source_code, declarator_node)
-                class_info.constants.append(ConstInfo(
-                    name=const_name,
-                    type_name=const_type,
-                    is_static=is_static
-                ))
-
-    # Traverse with access specifier tracking
-    def walk(node: Node):
-        nonlocal current_access
-
-        if node.type == 'access_specifier':
-            access_text = _get_node_text(source_code, node)
-            for access in ('public', 'private', 'protected'):
-                if access in access_text:
+    if template_name in _PROPERTY_TEMPLATES:
+        type_desc = _find_child_by_type(template_args, _TYPE_DESCRIPTOR)
+        prop_type = _normalize_type(source_code, type_desc) if type_desc else 'unknown'
+        class_info.properties.append(PropertyInfo(name=member_name, type_name=prop_type))
+    else:
+        arg_types = [_normalize_type(source_code, child)
+                     for child in template_args.children
+                     if child.type == 'type_descriptor']
+        class_info.events.append(EventInfo(name=member_name, arg_types=arg_types))
+
+
+# Member node type -> handler (keys are _MEMBER_TYPES)
+_MEMBER_HANDLERS = {
+    'enum_specifier': _handle_enum,
+    'function_definition': _handle_function_definition,
+    'field_declaration': _handle_field_declaration,
+}
+
+
+def _extract_all_members(source_code: bytes, class_body: Node, class_info: ClassInfo):
+    """Extract all members (properties, events, methods) in a single pass."""
+
+    current_access = 'private'  # Default access in class is private
+    class_name_bytes = class_info.name.encode('utf-8')
+
+    # Members and access specifiers come from one query (matched in C, in
+    # document order). Matches inside pruned subtrees (function bodies,
+    # nested classes) are skipped via the end byte of the pruned node.
+    matches = QueryCursor(_MEMBER_QUERY).matches(class_body)
+
+    # Property/Event-Treffer nach Knoten; bei "property<int> a, b;" zählt
+    # wie bisher nur der erste Deklarator
+    template_members: Dict[int, Dict[str, List[Node]]] = {}
+    for _, captures in matches:
+        if 'template_member' in captures:
+            template_members.setdefault(captures['template_member'][0].id, captures)
+
+    skip_end = -1
+    for _, captures in matches:
+        if 'node' not in captures:
+            continue
+        node = captures['node'][0]
+        if node.start_byte < skip_end or node.id == class_body.id:
+            continue
+        node_type = node.type
+
+        if node_type == 'access_specifier':
+            access_text = _node_bytes(source_code, node)
+            for token, access in _ACCESS_TOKENS:
+                if token in access_text:
                     current_access = access
                     break
-        else:
-            process_field(node, current_access)
-
-        for child in node.children:
-            walk(child)
+        elif current_access == 'public':
+            # Non-public members are ignored
+            template_member = template_members.get(node.id)
+            if template_member is not None:
+                _handle_template_member(source_code, template_member, class_info)
+            else:
+                handler = _MEMBER_HANDLERS.get(node_type)
+                if handler:
+                    handler(source_code, node, class_info, class_name_bytes)
 
-    walk(class_body)
+        # Nicht in Funktionsrümpfe und verschachtelte Klassen absteigen
+        if node_type in _MEMBER_PRUNE_TYPES:
+            skip_end = node.end_byte
 
 
-def _parse_class(source_code: bytes, node: Node, target_class_name: str, namespace: List[str] = None) -> Optional[ClassInfo]:
+def _parse_class(source_code: bytes, node: Node, target_class_name: Optional[str], namespace: List[str] = None) -> Optional[ClassInfo]:
     """Parse a class definition node.
 
     Args:
         source_code: The source code as bytes
         node: The AST node of the class
-        target_class_name: Name of the class to parse
+        target_class_name: Name of the class to parse (None accepts any class)
         namespace: List of namespace names (for nested namespaces)
     """
     class_name = None
@@ -430,7 +586,7 @@ def _parse_class(source_code: bytes, node: Node, target_class_name: str, namespa
         return None
 
     # Filtere nach Namen
-    if class_name != target_class_name:
+    if target_class_name is not None and class_name != target_class_name:
         return None
 
     class_info = ClassInfo(name=class_name, namespace=namespace or [])
@@ -448,9 +604,96 @@ def _parse_class(source_code: bytes, node: Node, target_class_name: str, namespa
     return class_info
 
 
+def _namespace_parts(source_code: bytes, node: Node) -> Tuple[Optional[str], Optional[Node]]:
+    """Return name and body of a namespace_definition node."""
+    ns_name = None
+    ns_body = None
+    for child in node.children:
+        if child.type == 'namespace_identifier':
+            ns_name = _get_node_text(source_code, child)
+        elif child.type == 'declaration_list':
+            ns_body = child
+    return ns_name, ns_body
+
+
+def _find_class_in_scope(source_code: bytes, node: Node, target_class_name: str,
+                         namespace: List[str]) -> Optional[ClassInfo]:
+    """Search the declarations at file and namespace scope only.
+
+    Descends into namespaces, preprocessor blocks, templates and linkage
+    specifications, but never into class or function bodies.
+    """
+    for child in node.children:
+        child_type = child.type
+
+        if child_type == 'class_specifier':
+            result = _parse_class(source_code, child, target_class_name, namespace)
+        elif child_type == 'namespace_definition':
+            ns_name, ns_body = _namespace_parts(source_code, child)
+            if ns_name and ns_body:
+                result = _find_class_in_scope(source_code, ns_body, target_class_name, namespace + [ns_name])
+            else:
+                result = _find_class_in_scope(source_code, child, target_class_name, namespace)
+        elif child_type in _SCOPE_CONTAINERS:
+            result = _find_class_in_scope(source_code, child, target_class_name, namespace)
+        else:
+            continue
+
+        if result:
+            return result
+
+    return None
+
+
+def _iter_class_nodes(source_code: bytes, node: Node, namespace: List[str]) -> Iterator[Tuple[Node, List[str]]]:
+    """Yield (class_specifier, namespace) pairs of the AST in source order.
+
+    Class and function bodies are not entered: nested and local classes are
+    never exposed.
+    """
+    # Iterative pre-order walk, the caller may stop at the first match
+    stack = [(node, namespace)]
+    while stack:
+        current, current_namespace = stack.pop()
+        current_type = current.type
+
+        if current_type == 'class_specifier':
+            # Nested classes are not exposed, no need to search class bodies
+            yield current, current_namespace
+            continue
+
+        # Lokale Klassen in Funktionsrümpfen sind nie Ziel der Registrierung
+        if current_type == 'compound_statement':
+            continue
+
+        # Bei namespace_definition: extrahiere Namen und durchsuche Inhalt
+        if current_type == 'namespace_definition':
+            ns_name, ns_body = _namespace_parts(source_code, current)
+            if ns_name and ns_body:
+                new_namespace = current_namespace + [ns_name]
+                stack.extend((child, new_namespace) for child in reversed(ns_body.children))
+                continue
+
+        stack.extend((child, current_namespace) for child in reversed(current.children))
+
+
+def _find_class_deep(source_code: bytes, node: Node, target_class_name: str, namespace: List[str]) -> Optional[ClassInfo]:
+    """Search the whole AST (except class and function bodies) for a specific class."""
+    for class_node, class_namespace in _iter_class_nodes(source_code, node, namespace):
+        result = _parse_class(source_code, class_node, target_class_name, class_namespace)
+        if result:
+            return result
+
+    return None
+
+
 def _find_class(source_code: bytes, node: Node, target_class_name: str, namespace: List[str] = None) -> Optional[ClassInfo]:
     """Search for a specific class in the AST.
 
+    Scope-level declarations are checked first, which covers the usual
+    header layout in O(top-level declarations). Only on a miss the whole
+    tree is searched.
+
     Args:
         source_code: The source code as bytes
         node: The current AST node
@@ -462,42 +705,131 @@ def _find_class(source_code: bytes, node: Node, target_class_name: str, namespac
     """
     if namespace is None:
         namespace = []
-    
-    if node.type == 'class_specifier':
-        class_info = _parse_class(source_code, node, target_class_name, namespace)
-        if class_info:
-            return class_info
-    
-    # Bei namespace_definition: extrahiere Namen und durchsuche Inhalt
-    if node.type == 'namespace_definition':
-        ns_name = None
-        ns_body = None
-        for child in node.children:
-            if child.type == 'namespace_identifier':
-                ns_name = _get_node_text(source_code, child)
-            elif child.type == 'declaration_list':
-                ns_body = child
-        
-        if ns_name and ns_body:
-            new_namespace = namespace + [ns_name]
-            for child in ns_body.children:
-                result = _find_class(source_code, child, target_class_name, new_namespace)
-                if result:
-                    return result
-            return None
 
-    for child in node.children:
-        result = _find_class(source_code, child, target_class_name, namespace)
-        if result:
-            return result
-    
-    return None
+    return (_find_class_in_scope(source_code, node, target_class_name, namespace)
+            or _find_class_deep(source_code, node, target_class_name, namespace))
+
+
+def _collect_classes(source_code: bytes, node: Node, class_names: Optional[frozenset],
+                     result: Dict[str, ClassInfo], namespace: List[str] = None):
+    """Collect all classes of the AST in a single traversal.
+
+    Uses the same walk as _find_class_deep, so both find the same classes.
+
+    Args:
+        source_code: The source code as bytes
+        node: The root AST node
+        class_names: Names of the classes to collect (None collects all)
+        result: Mapping class name -> ClassInfo, filled in place
+        namespace: Current namespace hierarchy
+    """
+    if namespace is None:
+        namespace = []
+
+    for class_node, class_namespace in _iter_class_nodes(source_code, node, namespace):
+        name_node = _find_child_by_type(class_node, _TYPE_IDENTIFIER)
+        if not name_node:
+            continue
+        class_name = _get_node_text(source_code, name_node)
+        # Erster Treffer gewinnt (wie bei _find_class)
+        if class_name not in result and (class_names is None or class_name in class_names):
+            class_info = _parse_class(source_code, class_node, class_name, class_namespace)
+            if class_info:
+                result[class_name] = class_info
 
 
 # =============================================================================
 # Public API
 # =============================================================================
 
+@contextmanager
+def _map_source(header_path: str) -> Iterator[bytes]:
+    """Map a header file read-only into memory instead of copying it.
+
+    Slicing the mapping yields bytes, so it can be used wherever the parser
+    expects the source code. Empty files cannot be mapped and are read.
+    """
+    with open(header_path, 'rb') as f:
+        try:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            yield f.read()
+            return
+        with mapping:
+            yield mapping
+
+
+# Marker for a cache miss (None is a valid cached result: class not found)
+_CACHE_MISS = object()
+
+
+def _load_cached(key: str):
+    """Return the cached result for key, or _CACHE_MISS.
+
+    The cache is best-effort: entries that cannot be unpickled (truncated
+    blobs, classes pickled under another module name, ...) count as a miss
+    and are overwritten by the fresh result.
+    """
+    blob = _ast_cache.get(key)
+    if blob is None:
+        return _CACHE_MISS
+    try:
+        return pickle.loads(blob)
+    except Exception:
+        return _CACHE_MISS
+
+
+def _store_cached(key: str, result):
+    """Pickle result into the cache under key (nothing to do if the cache is disabled)."""
+    if _ast_cache.enabled():
+        _ast_cache.put(key, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def parse_header_bytes(source_code: bytes, class_name: str, tree: Optional[Tree] = None) -> Optional[ClassInfo]:
+    """Extract a specific class from C++ header content already in memory.
+
+    Args:
+        source_code: Content of the header file
+        class_name: Name of the class to parse
+        tree: Already parsed tree of source_code (skips the tree-sitter pass)
+
+    Returns:
+        ClassInfo object if the class was found, None otherwise
+    """
+    # Konservativer Vorfilter: ohne den Namen im Text gibt es die Klasse nicht
+    # (find() statt "in": funktioniert auch für mmap-Objekte)
+    if source_code.find(_CLASS_TOKEN) < 0 or source_code.find(class_name.encode('utf-8')) < 0:
+        return None
+
+    # Ohne Cache weder Schlüssel (SHA-256) noch Pickle berechnen
+    key = None
+    if _ast_cache.enabled():
+        key = _ast_cache.cache_key(source_code, f"classinfo:{class_name}")
+        cached = _load_cached(key)
+        if cached is not _CACHE_MISS:
+            return cached
+
+    if tree is None:
+        tree = _PARSER.parse(source_code)
+    class_info = _find_class(source_code, tree.root_node, class_name)
+    if key is not None:
+        _store_cached(key, class_info)
+    return class_info
+
+
+def parse_header_source(source: str, class_name: str) -> Optional[ClassInfo]:
+    """Extract a specific class from C++ header text, without a file on disk.
+
+    Args:
+        source: Header text
+        class_name: Name of the class to parse
+
+    Returns:
+        ClassInfo object if the class was found, None otherwise
+    """
+    return parse_header_bytes(source.encode('utf-8'), class_name)
+
+
 def parse_header(header_path: str, class_name: str) -> Optional[ClassInfo]:
     """Parse a C++ header file and extract a specific class.
 
@@ -508,138 +840,269 @@ def parse_header(header_path: str, class_name: str) -> Optional[ClassInfo]:
     Returns:
         ClassInfo object if the class was found, None otherwise
     """
-    with open(Path(header_path).resolve(), 'rb') as f:
-        source_code = f.read()
+    with _map_source(header_path) as source_code:
+        return parse_header_bytes(source_code, class_name)
+
 
-    parser = Parser(Language(tscpp.language()))
-    tree = parser.parse(source_code)
-    return _find_class(source_code, tree.root_node, class_name)
+def parse_header_all_bytes(source_code: bytes, class_names: Optional[Iterable[str]] = None,
+                           tree: Optional[Tree] = None) -> Dict[str, ClassInfo]:
+    """Extract several classes from C++ header content already in memory.
+
+    Args:
+        source_code: Content of the header file
+        class_names: Names of the classes to extract (None extracts all)
+        tree: Already parsed tree of source_code (skips the tree-sitter pass)
+
+    Returns:
+        Mapping class name -> ClassInfo for every class that was found
+    """
+    wanted = frozenset(class_names) if class_names is not None else None
+    # Konservativer Vorfilter: keiner der Namen kommt im Text vor
+    if wanted is not None and all(source_code.find(name.encode('utf-8')) < 0 for name in wanted):
+        return {}
+
+    # Ohne Cache weder Schlüssel (SHA-256) noch Pickle berechnen
+    key = None
+    if _ast_cache.enabled():
+        tag = 'classinfo-all:' + (','.join(sorted(wanted)) if wanted is not None else '*')
+        key = _ast_cache.cache_key(source_code, tag)
+        cached = _load_cached(key)
+        if cached is not _CACHE_MISS:
+            return cached
+
+    if tree is None:
+        tree = _PARSER.parse(source_code)
+    result: Dict[str, ClassInfo] = {}
+    _collect_classes(source_code, tree.root_node, wanted, result)
+    if key is not None:
+        _store_cached(key, result)
+    return result
+
+
+def parse_header_all(header_path: str, class_names: Optional[Iterable[str]] = None) -> Dict[str, ClassInfo]:
+    """Parse a C++ header file once and extract several classes.
+
+    Args:
+        header_path: Path to the header file
+        class_names: Names of the classes to extract (None extracts all)
+
+    Returns:
+        Mapping class name -> ClassInfo for every class that was found
+    """
+    with _map_source(header_path) as source_code:
+        return parse_header_all_bytes(source_code, class_names)
 
 
 # =============================================================================
 # Report Generation
 # =============================================================================
 
-def generate_detailed_report(class_info: Optional[ClassInfo], header_path: str) -> str:
-    """Generate a detailed report about a parsed class."""
-    lines = [
-        "=" * 80,
-        "webbridge Parser - Detaillierter Report",
-        "=" * 80,
-        f"Header-Datei: {header_path}",
-        f"Klasse gefunden: {'Ja' if class_info else 'Nein'}",
-        ""
-    ]
+_LABELS_DE = {
+    'title': 'webbridge Parser - Detaillierter Report',
+    'header_file': 'Header-Datei',
+    'class_found': 'Klasse gefunden',
+    'yes': 'Ja',
+    'no': 'Nein',
+    'not_found': 'WARNUNG: Klasse nicht gefunden!',
+    'reasons': 'Mögliche Gründe:',
+    'reason_list': (
+        'Klasse existiert nicht in der Header-Datei',
+        'Falscher Klassenname angegeben',
+        'Syntaxfehler in der Header-Datei',
+    ),
+    'class': 'Klasse',
+    'properties': 'PROPERTIES',
+    'events': 'EVENTS',
+    'constants': 'CONSTANTS',
+    'enums': 'ENUMS',
+    'constructors': 'CONSTRUCTORS',
+    'sync_methods': 'SYNCHRONE METHODEN',
+    'async_methods': 'ASYNCHRONE METHODEN',
+    'no_properties': '(keine Properties gefunden)',
+    'no_events': '(keine Events gefunden)',
+    'no_constants': '(keine Konstanten gefunden)',
+    'no_enums': '(keine Enums gefunden)',
+    'no_values': '(keine Werte)',
+    'no_constructors': '(keine Konstruktoren gefunden)',
+    'no_sync_methods': '(keine synchronen Methoden gefunden)',
+    'no_async_methods': '(keine asynchronen Methoden gefunden)',
+    'summary': 'ZUSAMMENFASSUNG',
+    'total_members': 'Gesamtzahl Members',
+    'summary_labels': ('Properties', 'Events', 'Constants', 'Enums', 'Constructors',
+                       'Sync Methoden', 'Async Methoden'),
+    'report_end': 'Report-Ende',
+}
+
+_LABELS_EN = {
+    'title': 'webbridge Parser - Detailed Report',
+    'header_file': 'Header file',
+    'class_found': 'Class found',
+    'yes': 'Yes',
+    'no': 'No',
+    'not_found': 'WARNING: Class not found!',
+    'reasons': 'Possible reasons:',
+    'reason_list': (
+        'Class does not exist in the header file',
+        'Wrong class name specified',
+        'Syntax error in the header file',
+    ),
+    'class': 'Class',
+    'properties': 'PROPERTIES',
+    'events': 'EVENTS',
+    'constants': 'CONSTANTS',
+    'enums': 'ENUMS',
+    'constructors': 'CONSTRUCTORS',
+    'sync_methods': 'SYNC METHODS',
+    'async_methods': 'ASYNC METHODS',
+    'no_properties': '(no properties found)',
+    'no_events': '(no events found)',
+    'no_constants': '(no constants found)',
+    'no_enums': '(no enums found)',
+    'no_values': '(no values)',
+    'no_constructors': '(no constructors found)',
+    'no_sync_methods': '(no sync methods found)',
+    'no_async_methods': '(no async methods found)',
+    'summary': 'SUMMARY',
+    'total_members': 'Total members',
+    'summary_labels': ('Properties', 'Events', 'Constants', 'Enums', 'Constructors',
+                       'Sync methods', 'Async methods'),
+    'report_end': 'End of report',
+}
+
+REPORT_LABELS = {'de': _LABELS_DE, 'en': _LABELS_EN}
+
+
+def generate_detailed_report(class_info: Optional[ClassInfo], header_path: str,
+                             labels: Dict[str, object] = _LABELS_DE) -> str:
+    """Generate a detailed report about a parsed class.
+
+    Args:
+        class_info: Parsed class (None if the class was not found)
+        header_path: Path of the parsed header file
+        labels: Report texts, one of the REPORT_LABELS entries (German by default)
+    """
+    lbl = labels
+    buf = io.StringIO()
+    w = buf.write
+    rule = "=" * 80
+    section_rule = "-" * 40
+
+    w(f"{rule}\n{lbl['title']}\n{rule}\n")
+    w(f"{lbl['header_file']}: {header_path}\n")
+    w(f"{lbl['class_found']}: {lbl['yes'] if class_info else lbl['no']}\n\n")
 
     if not class_info:
-        lines.extend([
-            "WARNUNG: Klasse nicht gefunden!",
-            "",
-            "Mögliche Gründe:",
-            "  - Klasse existiert nicht in der Header-Datei",
-            "  - Falscher Klassenname angegeben",
-            "  - Syntaxfehler in der Header-Datei",
-            "=" * 80
-        ])
-        return "\n".join(lines)
+        w(f"{lbl['not_found']}\n\n{lbl['reasons']}\n")
+        for reason in lbl['reason_list']:
+            w(f"  - {reason}\n")
+        w(rule)
+        return buf.getvalue()
 
     cls = class_info
-    lines.extend([
-        "-" * 80,
-        f"Klasse: {cls.name}",
-        "-" * 80,
-        "",
-        f"PROPERTIES ({len(cls.properties)})",
-        "-" * 40
-    ])
+    w(f"{'-' * 80}\n{lbl['class']}: {cls.name}\n{'-' * 80}\n")
 
+    w(f"\n{lbl['properties']} ({len(cls.properties)})\n{section_rule}\n")
     if cls.properties:
         max_len = max(len(p.name) for p in cls.properties)
-        lines.extend(f"  • {p.name.ljust(max_len)} : {p.type_name}" for p in cls.properties)
+        for p in cls.properties:
+            w(f"  • {p.name:<{max_len}} : {p.type_name}\n")
     else:
-        lines.append("  (keine Properties gefunden)")
-
-    lines.extend(["", f"EVENTS ({len(cls.events)})", "-" * 40])
+        w(f"  {lbl['no_properties']}\n")
 
+    w(f"\n{lbl['events']} ({len(cls.events)})\n{section_rule}\n")
     if cls.events:
         max_len = max(len(e.name) for e in cls.events)
-        lines.extend(f"  • {e.name.ljust(max_len)} : Event<{', '.join(e.arg_types)}>"
-                     if e.arg_types else f"  • {e.name.ljust(max_len)} : Event<>"
-                     for e in cls.events)
+        for e in cls.events:
+            w(f"  • {e.name:<{max_len}} : Event<{', '.join(e.arg_types)}>\n")
     else:
-        lines.append("  (keine Events gefunden)")
-
-    lines.extend(["", f"CONSTANTS ({len(cls.constants)})", "-" * 40])
+        w(f"  {lbl['no_events']}\n")
 
+    w(f"\n{lbl['constants']} ({len(cls.constants)})\n{section_rule}\n")
     if cls.constants:
         max_len = max(len(c.name) for c in cls.constants)
         for const in cls.constants:
             static_prefix = 'static ' if const.is_static else ''
-            lines.append(f"  - {const.name.ljust(max_len)} : {static_prefix}{const.type_name}")
+            w(f"  - {const.name:<{max_len}} : {static_prefix}{const.type_name}\n")
     else:
-        lines.append("  (keine Konstanten gefunden)")
-
-    lines.extend(["", f"ENUMS ({len(cls.enums)})", "-" * 40])
+        w(f"  {lbl['no_constants']}\n")
 
+    w(f"\n{lbl['enums']} ({len(cls.enums)})\n{section_rule}\n")
     if cls.enums:
         for enum in cls.enums:
             enum_type = 'enum class' if enum.is_enum_class else 'enum'
-            values_str = ', '.join(enum.enum_values) if enum.enum_values else '(keine Werte)'
-            lines.append(f"  • {enum.name} [{enum_type}]: {{{values_str}}}")
+            values_str = ', '.join(enum.enum_values) if enum.enum_values else lbl['no_values']
+            w(f"  • {enum.name} [{enum_type}]: {{{values_str}}}\n")
     else:
-        lines.append("  (keine Enums gefunden)")
-
-    lines.extend(["", f"CONSTRUCTORS ({len(cls.constructors)})", "-" * 40])
+        w(f"  {lbl['no_enums']}\n")
 
+    w(f"\n{lbl['constructors']} ({len(cls.constructors)})\n{section_rule}\n")
     if cls.constructors:
         for ctor in cls.constructors:
-            if ctor.parameters:
-                lines.append(f"  • {ctor.name}({', '.join(f'{t} {n}' for t, n in ctor.parameters)})")
-            else:
-                lines.append(f"  • {ctor.name}()")
+            w(f"  • {ctor.name}({ctor.signature})\n")
     else:
-        lines.append("  (keine Konstruktoren gefunden)")
-
-    lines.extend(["", f"SYNCHRONE METHODEN ({len(cls.sync_methods)})", "-" * 40])
+        w(f"  {lbl['no_constructors']}\n")
 
+    w(f"\n{lbl['sync_methods']} ({len(cls.sync_methods)})\n{section_rule}\n")
     if cls.sync_methods:
-        lines.extend(f"  • {m.name}({', '.join(f'{t} {n}' for t, n in m.parameters)}) -> {m.return_type}"
-                     for m in cls.sync_methods)
+        for m in cls.sync_methods:
+            w(f"  • {m.name}({m.signature}) -> {m.return_type}\n")
     else:
-        lines.append("  (keine synchronen Methoden gefunden)")
-
-    lines.extend(["", f"ASYNCHRONE METHODEN ({len(cls.async_methods)})", "-" * 40])
+        w(f"  {lbl['no_sync_methods']}\n")
 
+    w(f"\n{lbl['async_methods']} ({len(cls.async_methods)})\n{section_rule}\n")
     if cls.async_methods:
-        lines.extend(f"  • {m.name}({', '.join(f'{t} {n}' for t, n in m.parameters)}) -> {m.return_type} [ASYNC]"
-                     for m in cls.async_methods)
+        for m in cls.async_methods:
+            w(f"  • {m.name}({m.signature}) -> {m.return_type} [ASYNC]\n")
     else:
-        lines.append("  (keine asynchronen Methoden gefunden)")
-
-    total = len(cls.properties) + len(cls.events) + len(cls.constants) + len(cls.enums) + len(cls.constructors) + len(cls.sync_methods) + len(cls.async_methods)
-    lines.extend([
-        "",
-        "ZUSAMMENFASSUNG",
-        "-" * 40,
-        f"  Gesamtzahl Members: {total}",
-        f"    - Properties:      {len(cls.properties)}",
-        f"    - Events:          {len(cls.events)}",
-        f"    - Constants:       {len(cls.constants)}",
-        f"    - Enums:           {len(cls.enums)}",
-        f"    - Constructors:    {len(cls.constructors)}",
-        f"    - Sync Methoden:   {len(cls.sync_methods)}",
-        f"    - Async Methoden:  {len(cls.async_methods)}",
-        ""
-    ])
-
-    lines.extend(["=" * 80, "Report-Ende", "=" * 80])
-    return "\n".join(lines)
+        w(f"  {lbl['no_async_methods']}\n")
+
+    counts = (len(cls.properties), len(cls.events), len(cls.constants), len(cls.enums),
+              len(cls.constructors), len(cls.sync_methods), len(cls.async_methods))
+    w(f"\n{lbl['summary']}\n{section_rule}\n")
+    w(f"  {lbl['total_members']}: {sum(counts)}\n")
+    for label, count in zip(lbl['summary_labels'], counts):
+        w(f"    - {label + ':':<17}{count}\n")
+    w("\n")
+
+    w(f"{rule}\n{lbl['report_end']}\n{rule}")
+    return buf.getvalue()
 
 
 # =============================================================================
 # Command Line Interface
 # =============================================================================
 
+# Ab dieser Anzahl Jobs lohnt sich der Start eines Prozess-Pools
+_PARALLEL_THRESHOLD = 16
+
+
+def _report_job(job: Tuple[str, str, str]) -> Tuple[str, bool]:
+    """Parse one (header, class, lang) job and return (report, found).
+
+    Runs in worker processes; each worker uses its own module-level parser.
+    """
+    header_file, class_name, lang = job
+    if not Path(header_file).exists():
+        return f"ERROR: Header file not found: {header_file}", False
+    class_info = parse_header(header_file, class_name)
+    return generate_detailed_report(class_info, header_file, REPORT_LABELS[lang]), class_info is not None
+
+
+def _read_batch_jobs(batch_file: str) -> List[Tuple[str, str]]:
+    """Read 'header.h|ClassName' lines from a file ('-' reads stdin)."""
+    lines = sys.stdin.read().splitlines() if batch_file == '-' else Path(batch_file).read_text(encoding='utf-8').splitlines()
+    jobs = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        if '|' not in line:
+            raise ValueError(f"Invalid batch line '{line}', expected 'header.h|ClassName'")
+        header_file, class_name = line.split('|', 1)
+        jobs.append((header_file.strip(), class_name.strip()))
+    return jobs
+
+
 def main():
     """Main entry point for command line usage."""
     import argparse
@@ -648,19 +1111,41 @@ def main():
         description='webbridge Parser - Analyze C++ header files for specific classes',
         epilog='Example: python parser.py ../src/MyObject.h --class-name MyObject'
     )
-    parser.add_argument('header_file', help='Path to the C++ header file')
-    parser.add_argument('-c', '--class-name', required=True, help='Name of the class to parse')
+    parser.add_argument('header_file', nargs='?', help='Path to the C++ header file')
+    parser.add_argument('-c', '--class-name', help='Name of the class to parse')
+    parser.add_argument('--batch', metavar='FILE',
+                        help="File with one 'header.h|ClassName' per line ('-' reads stdin)")
     parser.add_argument('-o', '--output', help='Output file for report (default: stdout)')
+    parser.add_argument('--lang', choices=sorted(REPORT_LABELS), default='de', help='Report language (default: de)')
 
     args = parser.parse_args()
 
-    if not Path(args.header_file).exists():
-        print(f"ERROR: Header file not found: {args.header_file}", file=sys.stderr)
-        sys.exit(1)
+    if args.batch:
+        if args.header_file or args.class_name:
+            parser.error('header_file and --class-name cannot be combined with --batch')
+    else:
+        if not args.header_file or not args.class_name:
+            parser.error('header_file and --class-name are required (or use --batch)')
+        if not Path(args.header_file).exists():
+            print(f"ERROR: Header file not found: {args.header_file}", file=sys.stderr)
+            sys.exit(1)
 
     try:
-        class_info = parse_header(args.header_file, args.class_name)
-        output = generate_detailed_report(class_info, args.header_file)
+        if args.batch:
+            jobs = [(header_file, class_name, args.lang) for header_file, class_name in _read_batch_jobs(args.batch)]
+            # Header sind unabhängig voneinander: bei vielen Jobs parallel parsen
+            if len(jobs) >= _PARALLEL_THRESHOLD:
+                from concurrent.futures import ProcessPoolExecutor
+                with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    results = list(executor.map(_report_job, jobs, chunksize=16))
+            else:
+                results = [_report_job(job) for job in jobs]
+            output = '\n\n'.join(report for report, _ in results)
+            all_found = all(found for _, found in results)
+        else:
+            class_info = parse_header(args.header_file, args.class_name)
+            output = generate_detailed_report(class_info, args.header_file, REPORT_LABELS[args.lang])
+            all_found = class_info is not None
 
         if args.output:
             Path(args.output).write_text(output, encoding='utf-8')
@@ -668,7 +1153,7 @@ def main():
         else:
             print(output)
 
-        sys.exit(0 if class_info else 1)
+        sys.exit(0 if all_found else 1)
 
     except Exception as e:
         print(f"ERROR while parsing: {e}", file=sys.stderr)
@@ -678,4 +1163,7 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    # Run through the importable module, not __main__: ClassInfo objects pickled
+    # into the cache (and sent to --batch workers) must resolve to parser.ClassInfo
+    import parser
+    parser.main()
@@ -7,30 +7,29 @@ Usage:
     python -m pytest test_parser.py -v
 """
 
+import functools
+import operator
 import pytest
-import tempfile
+import _burntest
 from pathlib import Path
-from parser import parse_header
+from parser import (generate_detailed_report, parse_header, parse_header_all, parse_header_all_bytes,
+                    parse_header_bytes, parse_header_source)
 
 
 # =============================================================================
 # Test Fixtures
 # =============================================================================
 
+# Forward declarations are enough, the parser only reads the class declarations
 PROPERTY_EVENT_TEMPLATE = """
 #pragma once
-template<typename T> class property {};
-template<typename... Args> class event {};
+template<typename T> class property;
+template<typename... Args> class event;
 """
 
-@pytest.fixture
-def temp_header(request):
-    """Create a temporary header file from request.param and clean up afterwards."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.h', delete=False, encoding='utf-8') as f:
-        f.write(request.param)
-        path = Path(f.name)
-    yield path
-    path.unlink()
+# Most fixtures are shared by several tests: parse each (source, class) pair only once.
+# The cache tests below call parse_header_source() directly, they must really parse.
+parse_cached = functools.lru_cache(maxsize=None)(parse_header_source)
 
 
 SIMPLE_CLASS = PROPERTY_EVENT_TEMPLATE + """
@@ -110,6 +109,16 @@ public:
 };
 """
 
+SPACED_TYPES = PROPERTY_EVENT_TEMPLATE + """
+class SpacedTypes {
+public:
+    property<std::map< std::string ,   std::vector < int > >> table;
+    property<unsigned   long
+        long> big;
+    property<std::vector<int /* ids */>> ids;
+};
+"""
+
 EMPTY_CLASS = "#pragma once\nclass EmptyClass { public: };"
 
 INLINE_METHODS = PROPERTY_EVENT_TEMPLATE + """
@@ -122,6 +131,28 @@ public:
 };
 """
 
+GUARDED_NESTED = """
+#ifndef GUARDED_H
+#define GUARDED_H
+template<typename T> class property {};
+namespace app {
+    class Outer {
+    public:
+        class Inner { public: property<int> hidden; };
+        property<int> visible;
+    };
+}
+#endif
+"""
+
+MULTI_CLASS = PROPERTY_EVENT_TEMPLATE + """
+namespace app {
+    class First { public: property<int> a; };
+    class Second { public: property<bool> b; void run(); };
+}
+class Third { public: event<> done; };
+"""
+
 NESTED_NAMESPACE = """
 #pragma once
 namespace a { namespace b { namespace c {
@@ -130,6 +161,73 @@ namespace a { namespace b { namespace c {
 """
 
 
+_names = operator.attrgetter("name")
+
+
+def by_name(members):
+    """Index parsed members (properties, events, methods, ...) by name."""
+    return {member.name: member for member in members}
+
+
+def must_parse(source, class_name):
+    """Parse class_name from source (cached) and fail right away if it is missing."""
+    result = parse_cached(source, class_name)
+    assert result is not None, f"{class_name} not found"
+    return result
+
+
+# Parse results shared by the whole session; tests only read them.
+
+@pytest.fixture(scope="session")
+def simple_parsed():
+    return must_parse(SIMPLE_CLASS, "SimpleClass")
+
+@pytest.fixture(scope="session")
+def complex_parsed():
+    return must_parse(COMPLEX_CLASS, "MyObject")
+
+@pytest.fixture(scope="session")
+def template_parsed():
+    return must_parse(TEMPLATE_TYPES, "TemplateTest")
+
+@pytest.fixture(scope="session")
+def access_parsed():
+    return must_parse(ACCESS_SPECIFIERS, "AccessTest")
+
+@pytest.fixture(scope="session")
+def spaced_parsed():
+    return must_parse(SPACED_TYPES, "SpacedTypes")
+
+@pytest.fixture(scope="session")
+def inline_parsed():
+    return must_parse(INLINE_METHODS, "InlineClass")
+
+@pytest.fixture(scope="session")
+def empty_parsed():
+    return must_parse(EMPTY_CLASS, "EmptyClass")
+
+@pytest.fixture(scope="session")
+def guarded_parsed():
+    return must_parse(GUARDED_NESTED, "Outer")
+
+@pytest.fixture(scope="session")
+def nested_parsed():
+    return must_parse(NESTED_NAMESPACE, "DeepClass")
+
+
+@pytest.fixture(scope="session")
+def headers_dir(tmp_path_factory):
+    """Directory for fixture headers that must exist on disk, created once per session."""
+    return tmp_path_factory.mktemp("hdr")
+
+@pytest.fixture(scope="session")
+def simple_header(headers_dir):
+    """SIMPLE_CLASS as a header file, for the path based entry points (read only)."""
+    header = headers_dir / "simple.h"
+    header.write_text(SIMPLE_CLASS, encoding="utf-8")
+    return header
+
+
 # =============================================================================
 # Property Tests
 # =============================================================================
@@ -137,28 +235,29 @@ namespace a { namespace b { namespace c {
 class TestProperties:
     """Tests for property parsing."""
     
-    @pytest.mark.parametrize("temp_header", [SIMPLE_CLASS], indirect=True, ids=["simple_class"])
-    def test_simple_properties(self, temp_header):
-        result = parse_header(str(temp_header), "SimpleClass")
-        assert result is not None
-        assert len(result.properties) == 2
-        assert {p.name for p in result.properties} == {"counter", "name"}
-        assert next(p for p in result.properties if p.name == "counter").type_name == "int"
+    def test_simple_properties(self, simple_parsed):
+        assert len(simple_parsed.properties) == 2
+        assert set(map(_names, simple_parsed.properties)) == {"counter", "name"}
+        assert by_name(simple_parsed.properties)["counter"].type_name == "int"
     
-    @pytest.mark.parametrize("temp_header", [TEMPLATE_TYPES], indirect=True, ids=["template_types"])
-    def test_complex_type_properties(self, temp_header):
-        result = parse_header(str(temp_header), "TemplateTest")
-        assert result is not None and len(result.properties) == 3
-        vec_prop = next(p for p in result.properties if p.name == "vecProp")
+    def test_complex_type_properties(self, template_parsed):
+        assert len(template_parsed.properties) == 3
+        vec_prop = by_name(template_parsed.properties)["vecProp"]
         assert "vector" in vec_prop.type_name and "int" in vec_prop.type_name
     
-    @pytest.mark.parametrize("temp_header", [ACCESS_SPECIFIERS], indirect=True, ids=["access_specifiers"])
-    def test_no_private_properties(self, temp_header):
-        result = parse_header(str(temp_header), "AccessTest")
-        assert result is not None and len(result.properties) == 2
-        prop_names = {p.name for p in result.properties}
+    def test_no_private_properties(self, access_parsed):
+        assert len(access_parsed.properties) == 2
+        prop_names = set(map(_names, access_parsed.properties))
         assert prop_names == {"publicProp", "anotherPublicProp"}
 
+    def test_type_whitespace_normalized(self, spaced_parsed):
+        types = {p.name: p.type_name for p in spaced_parsed.properties}
+        assert types == {
+            "table": "std::map<std::string,std::vector<int>>",
+            "big": "unsigned long long",
+            "ids": "std::vector<int>",
+        }
+
 
 # =============================================================================
 # Event Tests
@@ -167,17 +266,13 @@ class TestProperties:
 class TestEvents:
     """Tests for event parsing."""
     
-    @pytest.mark.parametrize("temp_header", [SIMPLE_CLASS], indirect=True, ids=["simple_class"])
-    def test_events_with_args(self, temp_header):
-        result = parse_header(str(temp_header), "SimpleClass")
-        assert result is not None and len(result.events) == 2
-        on_changed = next(e for e in result.events if e.name == "onChanged")
+    def test_events_with_args(self, simple_parsed):
+        assert len(simple_parsed.events) == 2
+        on_changed = by_name(simple_parsed.events)["onChanged"]
         assert on_changed.arg_types == ["int", "bool"] or len(on_changed.arg_types) == 2
     
-    @pytest.mark.parametrize("temp_header", [SIMPLE_CLASS], indirect=True, ids=["simple_class"])
-    def test_event_without_args(self, temp_header):
-        result = parse_header(str(temp_header), "SimpleClass")
-        on_reset = next(e for e in result.events if e.name == "onReset")
+    def test_event_without_args(self, simple_parsed):
+        on_reset = by_name(simple_parsed.events)["onReset"]
         assert len(on_reset.arg_types) == 0
 
 
@@ -188,44 +283,33 @@ class TestEvents:
 class TestMethods:
     """Tests for method parsing."""
     
-    @pytest.mark.parametrize("temp_header", [SIMPLE_CLASS], indirect=True, ids=["simple_class"])
-    def test_sync_methods(self, temp_header):
-        result = parse_header(str(temp_header), "SimpleClass")
-        assert result is not None and len(result.sync_methods) == 2
-        assert {m.name for m in result.sync_methods} == {"doSomething", "getValue"}
+    def test_sync_methods(self, simple_parsed):
+        assert len(simple_parsed.sync_methods) == 2
+        assert set(map(_names, simple_parsed.sync_methods)) == {"doSomething", "getValue"}
     
-    @pytest.mark.parametrize("temp_header", [COMPLEX_CLASS], indirect=True, ids=["complex_class"])
-    def test_async_methods(self, temp_header):
-        result = parse_header(str(temp_header), "MyObject")
-        assert result is not None and len(result.async_methods) == 2
-        assert {m.name for m in result.async_methods} == {"foo", "asyncMethod"}
+    def test_async_methods(self, complex_parsed):
+        assert len(complex_parsed.async_methods) == 2
+        assert set(map(_names, complex_parsed.async_methods)) == {"foo", "asyncMethod"}
     
-    @pytest.mark.parametrize("temp_header", [COMPLEX_CLASS], indirect=True, ids=["complex_class"])
-    def test_method_parameters(self, temp_header):
-        result = parse_header(str(temp_header), "MyObject")
-        multi_param = next(m for m in result.sync_methods if m.name == "multiParamTest")
+    def test_method_parameters(self, complex_parsed):
+        multi_param = by_name(complex_parsed.sync_methods)["multiParamTest"]
         assert len(multi_param.parameters) == 4
         param_types = [t for t, _ in multi_param.parameters]
         assert "int" in param_types[0] and "bool" in param_types[1]
     
-    @pytest.mark.parametrize("temp_header", [COMPLEX_CLASS], indirect=True, ids=["complex_class"])
-    def test_method_return_types(self, temp_header):
-        result = parse_header(str(temp_header), "MyObject")
-        bar = next(m for m in result.sync_methods if m.name == "bar")
+    def test_method_return_types(self, complex_parsed):
+        methods = by_name(complex_parsed.sync_methods)
+        bar = methods["bar"]
         assert bar.return_type == "bool"
-        multi = next(m for m in result.sync_methods if m.name == "multiParamTest")
+        multi = methods["multiParamTest"]
         assert "string" in multi.return_type
     
-    @pytest.mark.parametrize("temp_header", [INLINE_METHODS], indirect=True, ids=["inline_methods"])
-    def test_inline_methods(self, temp_header):
-        result = parse_header(str(temp_header), "InlineClass")
-        assert result is not None and len(result.sync_methods) == 3
-        assert {m.name for m in result.sync_methods} == {"getValue", "setValue", "isEmpty"}
+    def test_inline_methods(self, inline_parsed):
+        assert len(inline_parsed.sync_methods) == 3
+        assert set(map(_names, inline_parsed.sync_methods)) == {"getValue", "setValue", "isEmpty"}
     
-    @pytest.mark.parametrize("temp_header", [ACCESS_SPECIFIERS], indirect=True, ids=["access_specifiers"])
-    def test_no_private_methods(self, temp_header):
-        result = parse_header(str(temp_header), "AccessTest")
-        method_names = {m.name for m in result.sync_methods}
+    def test_no_private_methods(self, access_parsed):
+        method_names = set(map(_names, access_parsed.sync_methods))
         assert "publicMethod" in method_names
         assert "privateMethod" not in method_names and "protectedMethod" not in method_names
 
@@ -237,19 +321,15 @@ class TestMethods:
 class TestConstructors:
     """Tests for constructor parsing."""
     
-    @pytest.mark.parametrize("temp_header", [COMPLEX_CLASS], indirect=True, ids=["complex_class"])
-    def test_explicit_constructors(self, temp_header):
-        result = parse_header(str(temp_header), "MyObject")
-        assert result is not None and len(result.constructors) >= 1
-        default_ctor = next((c for c in result.constructors if not c.parameters), None)
+    def test_explicit_constructors(self, complex_parsed):
+        assert len(complex_parsed.constructors) >= 1
+        default_ctor = next((c for c in complex_parsed.constructors if not c.parameters), None)
         assert default_ctor is not None and default_ctor.name == "MyObject"
     
-    @pytest.mark.parametrize("temp_header", [SIMPLE_CLASS], indirect=True, ids=["simple_class"])
-    def test_default_constructor_added(self, temp_header):
-        result = parse_header(str(temp_header), "SimpleClass")
-        assert result is not None and len(result.constructors) == 1
-        assert result.constructors[0].name == "SimpleClass"
-        assert len(result.constructors[0].parameters) == 0
+    def test_default_constructor_added(self, simple_parsed):
+        assert len(simple_parsed.constructors) == 1
+        assert simple_parsed.constructors[0].name == "SimpleClass"
+        assert len(simple_parsed.constructors[0].parameters) == 0
 
 
 # =============================================================================
@@ -259,26 +339,19 @@ class TestConstructors:
 class TestConstants:
     """Tests for constant parsing."""
     
-    @pytest.mark.parametrize("temp_header", [COMPLEX_CLASS], indirect=True, ids=["complex_class"])
-    def test_const_members(self, temp_header):
-        result = parse_header(str(temp_header), "MyObject")
-        assert result is not None and len(result.constants) >= 2
-        assert {"version", "appversion"} <= {c.name for c in result.constants}
+    def test_const_members(self, complex_parsed):
+        assert len(complex_parsed.constants) >= 2
+        assert {"version", "appversion"} <= set(map(_names, complex_parsed.constants))
     
-    @pytest.mark.parametrize("temp_header", [COMPLEX_CLASS], indirect=True, ids=["complex_class"])
-    def test_static_const_detection(self, temp_header):
-        result = parse_header(str(temp_header), "MyObject")
-        appversion = next(c for c in result.constants if c.name == "appversion")
-        version = next(c for c in result.constants if c.name == "version")
+    def test_static_const_detection(self, complex_parsed):
+        constants = by_name(complex_parsed.constants)
+        appversion, version = constants["appversion"], constants["version"]
         assert appversion.is_static and not version.is_static
     
-    @pytest.mark.parametrize("temp_header", [COMPLEX_CLASS], indirect=True, ids=["complex_class"])
-    def test_inline_static_constexpr(self, temp_header):
-        result = parse_header(str(temp_header), "MyObject")
-        const_names = {c.name for c in result.constants}
-        if "cppversion" in const_names:
-            cppversion = next(c for c in result.constants if c.name == "cppversion")
-            assert cppversion.is_static
+    def test_inline_static_constexpr(self, complex_parsed):
+        constants = by_name(complex_parsed.constants)
+        if "cppversion" in constants:
+            assert constants["cppversion"].is_static
 
 
 # =============================================================================
@@ -288,11 +361,9 @@ class TestConstants:
 class TestEnums:
     """Tests for enum parsing."""
     
-    @pytest.mark.parametrize("temp_header", [COMPLEX_CLASS], indirect=True, ids=["complex_class"])
-    def test_inner_enum_class(self, temp_header):
-        result = parse_header(str(temp_header), "MyObject")
-        assert result is not None and len(result.enums) == 1
-        inner = result.enums[0]
+    def test_inner_enum_class(self, complex_parsed):
+        assert len(complex_parsed.enums) == 1
+        inner = complex_parsed.enums[0]
         assert inner.name == "InnerEnum" and inner.is_enum_class
         assert {"Value1", "Value2", "Value3"} <= set(inner.enum_values)
 
@@ -304,16 +375,203 @@ class TestEnums:
 class TestNamespaces:
     """Tests for namespace parsing."""
     
-    @pytest.mark.parametrize("temp_header", [SIMPLE_CLASS], indirect=True, ids=["simple_class"])
-    def test_class_without_namespace(self, temp_header):
-        result = parse_header(str(temp_header), "SimpleClass")
-        assert result is not None and result.namespace == []
+    def test_class_without_namespace(self, simple_parsed):
+        assert simple_parsed.namespace == []
+
+    def test_class_in_deeply_nested_namespace(self, nested_parsed):
+        assert nested_parsed.name == "DeepClass" and nested_parsed.namespace == ["a", "b", "c"]
+
+    def test_class_inside_include_guard(self, guarded_parsed):
+        assert guarded_parsed.namespace == ["app"]
+        assert "visible" in set(map(_names, guarded_parsed.properties))
+
+    def test_nested_class_not_exposed(self):
+        import parser
+        source = GUARDED_NESTED.encode("utf-8")
+        # Parse once, every lookup below reuses the same tree
+        tree = parser._PARSER.parse(source)
+        assert parse_header_bytes(source, "Inner", tree=tree) is None
+        assert "Inner" not in parse_header_all_bytes(source, tree=tree)
+        outer = parse_header_bytes(source, "Outer", tree=tree)
+        assert outer == parse_cached(GUARDED_NESTED, "Outer")
+        assert set(map(_names, outer.properties)) == {"visible"}
+
+
+# =============================================================================
+# Multi-Class Tests
+# =============================================================================
+
+class TestParseHeaderAll:
+    """Tests for parsing several classes of one header in a single pass."""
 
-    @pytest.mark.parametrize("temp_header", [NESTED_NAMESPACE], indirect=True, ids=["nested_namespace"])
-    def test_class_in_deeply_nested_namespace(self, temp_header):
-        result = parse_header(str(temp_header), "DeepClass")
-        assert result is not None
-        assert result.name == "DeepClass" and result.namespace == ["a", "b", "c"]
+    def test_all_classes(self):
+        result = parse_header_all_bytes(MULTI_CLASS.encode("utf-8"))
+        assert {"First", "Second", "Third"} <= set(result)
+        assert result["Second"].namespace == ["app"] and result["Third"].namespace == []
+        assert list(map(_names, result["Second"].sync_methods)) == ["run"]
+
+    def test_selected_classes(self):
+        result = parse_header_all_bytes(MULTI_CLASS.encode("utf-8"), ["Third", "Missing"])
+        assert set(result) == {"Third"}
+        assert result["Third"] == parse_cached(MULTI_CLASS, "Third")
+
+    def test_agrees_with_parse_header_on_local_and_nested(self):
+        source = GUARDED_NESTED + "inline void g() { class B { public: property<int> q; }; }\n"
+        result = parse_header_all_bytes(source.encode("utf-8"), ["Outer", "Inner", "B"])
+        assert set(result) == {"Outer"}
+        for name in ("Outer", "Inner", "B"):
+            assert result.get(name) == parse_header_source(source, name)
+
+
+# =============================================================================
+# Cache Tests
+# =============================================================================
+
+class TestAstCache:
+    """Tests for the persistent content-hash cache."""
+
+    def test_cache_roundtrip(self, tmp_path, monkeypatch):
+        import parser
+        monkeypatch.setenv("WEBBRIDGE_CACHE_DIR", str(tmp_path))
+        first = parse_header_source(SIMPLE_CLASS, "SimpleClass")
+        assert (tmp_path / "parser.db").exists()
+        # A hit must not parse again
+        monkeypatch.setattr(parser, "_PARSER", None)
+        assert parse_header_source(SIMPLE_CLASS, "SimpleClass") == first
+
+    def test_cache_invalidated_on_change(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("WEBBRIDGE_CACHE_DIR", str(tmp_path))
+        assert len(parse_header_source(SIMPLE_CLASS, "SimpleClass").properties) == 2
+        changed = SIMPLE_CLASS.replace("property<int> counter;", "")
+        assert len(parse_header_source(changed, "SimpleClass").properties) == 1
+
+    def test_class_info_slotted_and_picklable(self):
+        import pickle
+        result = parse_header_source(COMPLEX_CLASS, "MyObject")
+        assert not hasattr(result, "__dict__") and not hasattr(result.properties[0], "__dict__")
+        assert pickle.loads(pickle.dumps(result)) == result
+
+    def test_absent_class_skips_parsing(self, simple_header, monkeypatch):
+        import parser
+        monkeypatch.setattr(parser, "_PARSER", None)
+        assert parse_header_source(SIMPLE_CLASS, "Missing") is None
+        assert parse_header(str(simple_header), "Missing") is None
+        assert parse_header_all(str(simple_header), ["Missing"]) == {}
+
+    def test_cache_filled_by_cli_readable_on_import(self, simple_header, tmp_path, monkeypatch):
+        import subprocess
+        import sys
+        import parser
+        monkeypatch.setenv("WEBBRIDGE_CACHE_DIR", str(tmp_path))
+        cli = subprocess.run([sys.executable, parser.__file__, str(simple_header), "-c", "SimpleClass"],
+                             capture_output=True, text=True)
+        assert cli.returncode == 0, cli.stderr
+        # The CLI's entry must be a hit for the importing process, not a __main__.ClassInfo
+        monkeypatch.setattr(parser, "_PARSER", None)
+        assert parse_header(str(simple_header), "SimpleClass") == parse_cached(SIMPLE_CLASS, "SimpleClass")
+
+    def test_unreadable_cache_entry_is_a_miss(self, tmp_path, monkeypatch):
+        import _ast_cache
+        monkeypatch.setenv("WEBBRIDGE_CACHE_DIR", str(tmp_path))
+        source = SIMPLE_CLASS.encode("utf-8")
+        _ast_cache.put(_ast_cache.cache_key(source, "classinfo:SimpleClass"), b"\x80\x04truncated")
+        _ast_cache.put(_ast_cache.cache_key(source, "classinfo-all:*"), b"")
+        assert parse_header_bytes(source, "SimpleClass") == parse_cached(SIMPLE_CLASS, "SimpleClass")
+        assert set(parse_header_all_bytes(source)) == {"SimpleClass"}
+
+    def test_cache_invalidated_on_grammar_upgrade(self, tmp_path, monkeypatch):
+        import importlib.metadata
+        import _ast_cache
+        monkeypatch.setenv("WEBBRIDGE_CACHE_DIR", str(tmp_path))
+        source = SIMPLE_CLASS.encode("utf-8")
+        old_key = _ast_cache.cache_key(source, "classinfo:SimpleClass")
+        real_version = importlib.metadata.version
+        monkeypatch.setattr(importlib.metadata, "version",
+                            lambda name: "999.0" if name == "tree-sitter-cpp" else real_version(name))
+        _ast_cache._tools_digest.cache_clear()
+        try:
+            assert _ast_cache.cache_key(source, "classinfo:SimpleClass") != old_key
+        finally:
+            monkeypatch.undo()
+            _ast_cache._tools_digest.cache_clear()
+
+    def test_disabled_cache_skips_key_and_pickle(self, monkeypatch):
+        import _ast_cache
+        import parser
+        monkeypatch.delenv("WEBBRIDGE_CACHE_DIR", raising=False)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("cache work without WEBBRIDGE_CACHE_DIR")
+        monkeypatch.setattr(_ast_cache, "cache_key", fail)
+        monkeypatch.setattr(parser.pickle, "dumps", fail)
+        source = SIMPLE_CLASS.encode("utf-8")
+        assert parse_header_bytes(source, "SimpleClass") == parse_cached(SIMPLE_CLASS, "SimpleClass")
+        assert set(parse_header_all_bytes(source)) == {"SimpleClass"}
+
+    def test_discoverer_primes_class_info(self, tmp_path, monkeypatch):
+        import discoverer
+        import parser
+        monkeypatch.setenv("WEBBRIDGE_CACHE_DIR", str(tmp_path / "cache"))
+        header = tmp_path / "obj.h"
+        header.write_text(PROPERTY_EVENT_TEMPLATE + "class Obj : public webbridge::object { public: property<int> v; };",
+                          encoding="utf-8")
+        assert discoverer.find_webbridge_classes(str(header)) == ["Obj"]
+        # The generator must not parse the header again
+        monkeypatch.setattr(parser, "_PARSER", None)
+        assert list(map(_names, parse_header_all(str(header), ["Obj"])["Obj"].properties)) == ["v"]
+
+    def test_priming_failure_keeps_discovered_classes(self, tmp_path, monkeypatch):
+        import discoverer
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("priming failed")
+        monkeypatch.setattr(discoverer, "parse_header_all_bytes", fail)
+        monkeypatch.setenv("WEBBRIDGE_CACHE_DIR", str(tmp_path / "cache"))
+        header = tmp_path / "obj.h"
+        header.write_text(PROPERTY_EVENT_TEMPLATE + "class Obj : public webbridge::object {};", encoding="utf-8")
+        # First run (priming fails) and cached second run report the same classes
+        assert discoverer.find_webbridge_classes(str(header)) == ["Obj"]
+        assert discoverer.find_webbridge_classes(str(header)) == ["Obj"]
+
+
+# =============================================================================
+# Discoverer / Generator Tests
+# =============================================================================
+
+class TestDiscovererGenerator:
+    """Tests for the discoverer and generator command lines."""
+
+    def test_nested_and_local_object_subclasses_skipped(self, tmp_path):
+        import discoverer
+        import subprocess
+        import sys
+        header = tmp_path / "objs.h"
+        header.write_text(PROPERTY_EVENT_TEMPLATE + """
+namespace webbridge { class object {}; }
+class Outer : public webbridge::object {
+public:
+    class Inner : public webbridge::object {};
+    property<int> v;
+};
+inline void make() { class Local : public webbridge::object {}; }
+""", encoding="utf-8")
+        names = discoverer.find_webbridge_classes(str(header))
+        assert names == ["Outer"]
+        generator = Path(discoverer.__file__).with_name("generate.py")
+        cli = subprocess.run([sys.executable, str(generator), "--batch", *(f"{header}|{name}" for name in names),
+                              "--cpp_out", str(tmp_path / "out")], capture_output=True, text=True)
+        assert cli.returncode == 0, cli.stderr
+        assert (tmp_path / "out" / "Outer_registration.h").exists()
+
+    @pytest.mark.parametrize("classes", [",", " , ,"])
+    def test_generator_rejects_empty_class_list(self, classes, simple_header, tmp_path):
+        import subprocess
+        import sys
+        generator = Path(__file__).with_name("generate.py")
+        cli = subprocess.run([sys.executable, str(generator), str(simple_header), "--classes", classes,
+                              "--cpp_out", str(tmp_path / "out")], capture_output=True, text=True)
+        assert cli.returncode == 1 and "--classes" in cli.stderr
+        assert not (tmp_path / "out").exists()
 
 
 # =============================================================================
@@ -323,23 +581,89 @@ class TestNamespaces:
 class TestEdgeCases:
     """Tests for edge cases."""
     
-    @pytest.mark.parametrize("temp_header", [EMPTY_CLASS], indirect=True, ids=["empty_class"])
-    def test_empty_class(self, temp_header):
-        result = parse_header(str(temp_header), "EmptyClass")
-        assert result is not None and result.name == "EmptyClass"
-        assert len(result.properties) == 0 and len(result.events) == 0
-        assert len(result.sync_methods) == 0 and len(result.async_methods) == 0
-        assert len(result.constructors) == 1  # Default-Konstruktor
-    
-    @pytest.mark.parametrize("temp_header", [SIMPLE_CLASS], indirect=True, ids=["simple_class"])
-    def test_class_not_found(self, temp_header):
-        assert parse_header(str(temp_header), "NonExistentClass") is None
+    def test_empty_class(self, empty_parsed):
+        assert empty_parsed.name == "EmptyClass"
+        assert len(empty_parsed.properties) == 0 and len(empty_parsed.events) == 0
+        assert len(empty_parsed.sync_methods) == 0 and len(empty_parsed.async_methods) == 0
+        assert len(empty_parsed.constructors) == 1  # Default-Konstruktor
     
+    def test_class_not_found(self):
+        assert parse_cached(SIMPLE_CLASS, "NonExistentClass") is None
+
+    def test_type_cache_bounded(self):
+        import parser
+        limit = parser._normalize_type_text.cache_info().maxsize
+        members = "".join(f"property<T{i}> p{i};" for i in range(limit + 100))
+        source = PROPERTY_EVENT_TEMPLATE + f"class ManyTypes {{ public: {members} }};"
+        assert len(parse_header_source(source, "ManyTypes").properties) == limit + 100
+        assert parser._normalize_type_text.cache_info().currsize <= limit
+
+    def test_parse_from_file(self, simple_header):
+        from_file = parse_header(str(simple_header), "SimpleClass")
+        assert from_file is not None and from_file == parse_header_source(SIMPLE_CLASS, "SimpleClass")
+        assert from_file == parse_header_bytes(SIMPLE_CLASS.encode("utf-8"), "SimpleClass")
+        assert parse_header_all(str(simple_header)) == parse_header_all_bytes(SIMPLE_CLASS.encode("utf-8"))
+
     def test_file_not_found(self):
         with pytest.raises(FileNotFoundError):
             parse_header("/non/existent/path.h", "SomeClass")
 
 
+# =============================================================================
+# Real Header Tests
+# =============================================================================
+
+REAL_HEADER = Path(__file__).resolve().parent.parent / "src" / "MyObject.h"
+
+
+@pytest.fixture(scope="module")
+def real_myobject():
+    """src/MyObject.h, parsed once for all tests of this module."""
+    if not REAL_HEADER.exists():
+        pytest.skip(f"{REAL_HEADER} not found")
+    return parse_header(str(REAL_HEADER), "MyObject")
+
+
+@pytest.fixture(scope="module")
+def real_names(real_myobject):
+    """Member names of real_myobject per member list, built once."""
+    return {member: frozenset(map(_names, getattr(real_myobject, member)))
+            for member in ("properties", "events", "constants", "enums", "sync_methods", "async_methods")}
+
+
+class TestRealHeaderFile:
+    """Tests against the example header of the repository."""
+
+    def test_parse_real_myobject(self, real_myobject, real_names):
+        assert real_myobject is not None and real_myobject.name == "MyObject"
+        assert {"aBool", "strProp", "counter", "numbers", "status"} <= real_names["properties"]
+        assert "aEvent" in real_names["events"]
+        assert {"bar", "multiParamTest"} <= real_names["sync_methods"]
+        assert {"foo", "file"} <= real_names["async_methods"]
+        assert {"version", "appversion"} <= real_names["constants"]
+
+    def test_real_nested_enum(self, real_myobject, real_names):
+        assert real_names["enums"] == {"Status"}
+        assert real_myobject.qualify_type("Status") == "MyObject::Status"
+
+
+# =============================================================================
+# Report Tests
+# =============================================================================
+
+class TestReportGeneration:
+    """Tests for the text report (reuses the session parse of COMPLEX_CLASS)."""
+
+    def test_report_with_class(self, complex_parsed):
+        report = generate_detailed_report(complex_parsed, "complex.h")
+        required = {"MyObject", "PROPERTIES", "EVENTS", "SYNCHRONE METHODEN", "ASYNCHRONE METHODEN",
+                    "ZUSAMMENFASSUNG"}
+        missing = {kw for kw in required if kw not in report}
+        assert not missing, missing
+
+    def test_report_without_class(self):
+        report = generate_detailed_report(None, "missing.h")
+        assert "WARNUNG: Klasse nicht gefunden!" in report
 
 
 # =============================================================================
@@ -348,27 +672,7 @@ class TestEdgeCases:
 
 def run_burntest():
     """Run all tests and print a summary report."""
-    print("=" * 80)
-    print("webbridge Parser - Burntest")
-    print("=" * 80)
-    print()
-    
-    # Führe pytest aus
-    exit_code = pytest.main([
-        __file__,
-        "--tb=short",
-        "-x",  # Stop bei erstem Fehler
-    ])
-    
-    print()
-    print("=" * 80)
-    if exit_code == 0:
-        print("✅ Alle Tests erfolgreich!")
-    else:
-        print("❌ Einige Tests fehlgeschlagen!")
-    print("=" * 80)
-    
-    return exit_code
+    return _burntest.run("webbridge Parser", __file__, parallel=True)
 
 
 if __name__ == "__main__":
@@ -24,35 +24,12 @@
 # Benutzerdefinierte Typen sind durch to_json / from_json Serialisierer ebenfalls
 # voll integriert, aber das ist über C++ hinaus. [json.nlohmann.me]
 
+import functools
+import sys
+
 
 SCALAR_MAP = {
     'bool': 'boolean',
-    'char': 'number',
-    'signed char': 'number',
-    'unsigned char': 'number',
-    'short': 'number',
-    'short int': 'number',
-    'signed short': 'number',
-    'signed short int': 'number',
-    'unsigned short': 'number',
-    'unsigned short int': 'number',
-    'int': 'number',
-    'signed': 'number',
-    'signed int': 'number',
-    'unsigned': 'number',
-    'unsigned int': 'number',
-    'long': 'number',
-    'long int': 'number',
-    'signed long': 'number',
-    'signed long int': 'number',
-    'unsigned long': 'number',
-    'unsigned long int': 'number',
-    'long long': 'number',
-    'long long int': 'number',
-    'signed long long': 'number',
-    'signed long long int': 'number',
-    'unsigned long long': 'number',
-    'unsigned long long int': 'number',
     'uint8_t': 'number',
     'uint16_t': 'number',
     'uint32_t': 'number',
@@ -70,6 +47,29 @@ SCALAR_MAP = {
     'nullptr_t': 'null',
 }
 
+# parser.py liefert internierte Typnamen: mit internierten Schlüsseln entscheidet
+# beim Nachschlagen schon der Identitätsvergleich
+SCALAR_MAP = {sys.intern(k): v for k, v in SCALAR_MAP.items()}
+
+# Ganzzahltypen aus diesen Schlüsselwörtern (in beliebiger Reihenfolge, z.B.
+# "unsigned long long int" oder "long signed int") sind alle 'number'
+INT_QUALIFIERS = frozenset({'signed', 'unsigned', 'short', 'long', 'int', 'char'})
+
+
+def _is_int_type(words: list) -> bool:
+    """Prüft, ob die Schlüsselwörter einen gültigen C++ Ganzzahltyp ergeben.
+
+    Höchstens ein Vorzeichen und eine Größe (char, short, long oder long long),
+    int höchstens einmal und nie zusammen mit char, z.B. nicht "char char" oder
+    "signed unsigned".
+    """
+    if not words or not INT_QUALIFIERS.issuperset(words):
+        return False
+    chars, longs, ints = words.count('char'), words.count('long'), words.count('int')
+    return (words.count('signed') + words.count('unsigned') <= 1
+            and chars + words.count('short') + (longs > 0) <= 1
+            and longs <= 2 and ints <= 1 and not (chars and ints))
+
 SEQ_CONTAINER_MAP = {
     'std::vector': 'Array',
     'std::deque': 'Array',
@@ -84,6 +84,24 @@ ASSOC_CONTAINER_MAP = {
 }
 
 
+def _find_top_level_comma(types: str) -> int:
+    """Position des ersten Kommas außerhalb verschachtelter <...>, sonst -1."""
+    # Schachtelungstiefe an einem Komma = Anzahl '<' minus Anzahl '>' davor;
+    # find() und count() laufen in C statt Zeichen für Zeichen in Python
+    depth = 0
+    pos = 0
+    while True:
+        comma_pos = types.find(',', pos)
+        if comma_pos == -1:
+            return -1
+        depth += types.count('<', pos, comma_pos) - types.count('>', pos, comma_pos)
+        if depth == 0:
+            return comma_pos
+        pos = comma_pos + 1
+
+
+# Dieselben Typen kommen in einem Header sehr oft vor (auch rekursiv als innere Typen)
+@functools.lru_cache(maxsize=2048)
 def cpp_to_ts_type(cpp_type: str) -> str:
     """Konvertiert C++ Typen zu TypeScript Typen."""
     cpp_type = cpp_type.strip()
@@ -94,50 +112,53 @@ def cpp_to_ts_type(cpp_type: str) -> str:
     if cpp_type in SCALAR_MAP:
         return SCALAR_MAP[cpp_type]
 
+    # Containername vor dem ersten '<' bestimmt die Art des Containers
+    lt = cpp_type.find('<')
+    if lt <= 0:
+        # Prüfe auf Ganzzahltypen
+        if _is_int_type(cpp_type.split()):
+            return 'number'
+        return 'unknown'
+    container_name = cpp_type[:lt]
+
     # Prüfe auf Sequenz-Container (vector, list, deque, array)
-    for container_name in SEQ_CONTAINER_MAP:
-        if cpp_type.startswith(container_name + '<'):
-            # Extrahiere den inneren Typ
-            start = cpp_type.index('<') + 1
-            end = cpp_type.rindex('>')
-            inner = cpp_type[start:end].strip()
+    if container_name in SEQ_CONTAINER_MAP:
+        # Extrahiere den inneren Typ
+        start = lt + 1
+        end = cpp_type.rindex('>')
+        inner = cpp_type[start:end].strip()
 
-            # Für std::array, entferne die Größe (z.B. std::array<int, 10> -> int)
-            if container_name == 'std::array' and ',' in inner:
-                inner = inner[:inner.index(',')].strip()
+        # Für std::array, entferne die Größe (z.B. std::array<int, 10> -> int)
+        if container_name == 'std::array' and ',' in inner:
+            inner = inner[:inner.index(',')].strip()
 
-            inner_ts = cpp_to_ts_type(inner)
-            return f'{inner_ts}[]'
+        inner_ts = cpp_to_ts_type(inner)
+        return f'{inner_ts}[]'
 
     # Prüfe auf assoziative Container (map, unordered_map)
-    for container_name in ASSOC_CONTAINER_MAP:
-        if cpp_type.startswith(container_name + '<'):
-            # Extrahiere Key und Value Typen
-            start = cpp_type.index('<') + 1
-            end = cpp_type.rindex('>')
-            types = cpp_type[start:end].strip()
-
-            # Finde das Komma zwischen Key und Value (beachte verschachtelte Templates)
-            depth = 0
-            comma_pos = -1
-            for i, c in enumerate(types):
-                if c == '<':
-                    depth += 1
-                elif c == '>':
-                    depth -= 1
-                elif c == ',' and depth == 0:
-                    comma_pos = i
-                    break
-
-            if comma_pos != -1:
-                key_type = types[:comma_pos].strip()
-                value_type = types[comma_pos+1:].strip()
-
-                # Key muss std::string sein für JSON
-                if key_type != 'std::string':
-                    return 'unknown'
-
-                value_ts = cpp_to_ts_type(value_type)
-                return f'Record<string, {value_ts}>'
-
-    return 'unknown'
\ No newline at end of file
+    if container_name in ASSOC_CONTAINER_MAP:
+        # Extrahiere Key und Value Typen
+        start = lt + 1
+        end = cpp_type.rindex('>')
+        types = cpp_type[start:end].strip()
+
+        # Häufigster Fall std::string als Key: keine Suche nach dem Komma nötig
+        if types.startswith(('std::string,', 'std::string ,')):
+            value_ts = cpp_to_ts_type(types[types.index(',') + 1:].strip())
+            return f'Record<string, {value_ts}>'
+
+        # Finde das Komma zwischen Key und Value (beachte verschachtelte Templates)
+        comma_pos = _find_top_level_comma(types)
+
+        if comma_pos != -1:
+            key_type = types[:comma_pos].strip()
+            value_type = types[comma_pos+1:].strip()
+
+            # Key muss std::string sein für JSON
+            if key_type != 'std::string':
+                return 'unknown'
+
+            value_ts = cpp_to_ts_type(value_type)
+            return f'Record<string, {value_ts}>'
+
+    return 'unknown'